@@ -33,7 +33,7 @@ from cyberspace_cli.nostr_keys import (
     pubkey_hex_from_privkey,
 )
 from cyberspace_cli.state import CyberspaceState, STATE_VERSION, load_state, save_state
-from cyberspace_core.cantor import int_to_bytes_be_min, int_to_hex_be_min, sha256, sha256_int_hex
+from cyberspace_core.cantor import int_to_bytes_be_min, int_to_hex_be_min, sha256_int_chain_hex
 from cyberspace_core.coords import AXIS_MAX, coord_to_xyz, dataspace_coord_to_gps, gps_to_dataspace_coord, xyz_to_coord
 from cyberspace_core.geoid import (
     DEFAULT_GEOID_MODEL,
@@ -164,6 +164,13 @@ def _require_coord_xyz(coord: Optional[str]) -> Tuple[int, int, int, int]:
     return coord_to_xyz(coord_int)
 
 
+def _echo_gui_deps_missing(what: str, e: Exception) -> None:
+    typer.echo(f"{what} dependencies are not installed.", err=True)
+    typer.echo("Install extras: pip install 'cyberspace-cli[visualizer]'", err=True)
+    typer.echo("System deps: you may also need python3-tk.", err=True)
+    typer.echo(f"Import error: {e}", err=True)
+
+
 def _load_event_from_input(*, event_json: Optional[str], event_file: Optional[str]) -> dict:
     if (event_json is None and event_file is None) or (event_json is not None and event_file is not None):
         typer.echo("Specify exactly one of --event-json or --event-file.", err=True)
@@ -825,10 +832,7 @@ def lcaplot(
     try:
         from cyberspace_cli.visualizer.lcaplot_app import run_app  # type: ignore
     except Exception as e:
-        typer.echo("LCA plot dependencies are not installed.", err=True)
-        typer.echo("Install extras: pip install 'cyberspace-cli[visualizer]'", err=True)
-        typer.echo("System deps: you may also need python3-tk.", err=True)
-        typer.echo(f"Import error: {e}", err=True)
+        _echo_gui_deps_missing("LCA plot", e)
         raise typer.Exit(code=1)
 
     try:
@@ -842,6 +846,10 @@ def lcaplot(
             current_y=cury,
             current_z=curz,
         )
+    except ImportError as e:
+        # matplotlib's Tk backend is imported by run_app itself, not at module import.
+        _echo_gui_deps_missing("LCA plot", e)
+        raise typer.Exit(code=1)
     except Exception as e:
         typer.echo(f"Failed to launch lcaplot: {e}", err=True)
         raise typer.Exit(code=1)
@@ -911,10 +919,7 @@ def three_d(
     try:
         from cyberspace_cli.visualizer.app import run_app  # type: ignore
     except Exception as e:
-        typer.echo("3D visualizer dependencies are not installed.", err=True)
-        typer.echo("Install extras: pip install 'cyberspace-cli[visualizer]'", err=True)
-        typer.echo("System deps: you may also need python3-tk.", err=True)
-        typer.echo(f"Import error: {e}", err=True)
+        _echo_gui_deps_missing("3D visualizer", e)
         raise typer.Exit(code=1)
 
     effective_scale = float(scale) if scale is not None else (1.0 if sector else 0.5)
@@ -933,6 +938,10 @@ def three_d(
             earth_altitude_km=effective_earth_altitude_km,
             mode=("sector" if sector else "dataspace"),
         )
+    except ImportError as e:
+        # matplotlib's Tk backend is imported by run_app itself, not at module import.
+        _echo_gui_deps_missing("3D visualizer", e)
+        raise typer.Exit(code=1)
     except Exception as e:
         typer.echo(f"Failed to launch visualizer: {e}", err=True)
         raise typer.Exit(code=1)
@@ -1222,11 +1231,10 @@ def cantor(
     cz = _print_axis("Z", z1, z2)
 
     # Combine in 3D.
-    from cyberspace_core.cantor import cantor_pair
+    from cyberspace_core.cantor import cantor_triple
 
-    combined = cantor_pair(cantor_pair(cx, cy), cz)
-    encryption_key_hex = sha256_int_hex(combined)
-    discovery_id_hex = sha256(bytes.fromhex(encryption_key_hex)).hex()
+    combined = cantor_triple(cx, cy, cz)
+    encryption_key_hex, discovery_id_hex = sha256_int_chain_hex(combined)
 
     combined_bytes = int_to_bytes_be_min(combined)
 
@@ -1,9 +1,30 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 
 from cyberspace_core.coords import AXIS_MAX
-from cyberspace_core.movement import find_lca_height
+
+try:  # Optional: vectorized heights for large spans (installed with the visualizer extra).
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+    HAS_NUMPY = False
+
+try:  # Optional: fused single-pass kernel, no temporaries (only if numba is installed).
+    from numba import njit, prange
+
+    HAS_NUMBA = HAS_NUMPY
+except ImportError:
+    HAS_NUMBA = False
+
+# Below this many points the plain loop beats NumPy's setup cost.
+_NUMPY_MIN_POINTS = 64
+# Axis values are 85-bit; only their low 62 bits are carried in int64 lanes.
+_LOW_BITS = 62
+_LOW_MASK = (1 << _LOW_BITS) - 1
 
 
 @dataclass(frozen=True)
@@ -46,12 +67,10 @@ def compute_adjacent_lca_heights(*, center: int, span: int, direction: int) -> L
         start = max(raw_start, 1)
         end = raw_end
 
-    offsets: list[int] = []
-    heights: list[int] = []
-
-    for v in range(start, end + 1):
-        offsets.append(v - center)
-        heights.append(find_lca_height(v, v + direction))
+    offsets = list(range(start - center, end - center + 1))
+    # For adjacent values, h(v, v+1) = ctz(v+1) + 1 and h(v, v-1) = ctz(v) + 1.
+    first_u = start + 1 if direction == 1 else start
+    heights = _ctz_plus_one_run(first_u, end - start + 1)
 
     return LCAPlotSeries(
         center=center,
@@ -63,6 +82,48 @@ def compute_adjacent_lca_heights(*, center: int, span: int, direction: int) -> L
     )
 
 
+if HAS_NUMBA:
+
+    @njit(parallel=True, cache=True)
+    def _ctz_plus_one_kernel(low0, out):  # pragma: no cover - requires numba
+        # out[i] = ctz(low0 + i) + 1, or 0 where the low 62 bits are all zero.
+        for i in prange(out.shape[0]):
+            u = low0 + i
+            if (u & _LOW_MASK) == 0:
+                out[i] = 0
+            else:
+                out[i] = math.frexp(float(u & -u))[1]
+
+
+def _ctz_plus_one_run(first_u: int, n: int) -> list[int]:
+    """Return [ctz(u) + 1 for u in range(first_u, first_u + n)] (all u > 0).
+
+    This equals find_lca_height(u - 1, u), the ruler sequence of adjacent hops.
+    """
+
+    if n <= 0:
+        return []
+    if not HAS_NUMPY or n < _NUMPY_MIN_POINTS or n > _LOW_MASK:
+        return [(u & -u).bit_length() for u in range(first_u, first_u + n)]
+
+    # Trailing zeros only depend on low bits, so work on the low 62 bits in int64
+    # (low + i < 2^63 cannot overflow). frexp's exponent of the lowest set bit 2^k is k+1.
+    low0 = first_u & _LOW_MASK
+    if HAS_NUMBA:
+        heights = np.empty(n, dtype=np.int64)
+        _ctz_plus_one_kernel(np.int64(low0), heights)
+    else:
+        u = np.arange(n, dtype=np.int64) + low0
+        heights = np.frexp((u & -u).astype(np.float64))[1].astype(np.int64)
+        heights[(u & _LOW_MASK) == 0] = 0
+
+    # Lanes whose low 62 bits are all zero (marked 0) have ctz >= 62: resolve exactly.
+    for i in np.flatnonzero(heights == 0).tolist():
+        v = first_u + i
+        heights[i] = (v & -v).bit_length()
+    return heights.tolist()
+
+
 def block_boundary_offsets(*, center: int, series_start: int, series_end: int, h: int) -> tuple[list[int], list[int]]:
     """Return offsets (relative to center) where 2^h blocks start/end.
 
@@ -6,6 +6,14 @@ from typing import Any, Dict, List, Sequence
 
 from cyberspace_core.coords import coord_to_xyz
 
+# Constant action tags, built once at import. Tuples serialize as JSON arrays, so
+# they can be handed to serialize_event_for_id as-is; new_event() still returns
+# plain lists for callers.
+_SPAWN_A_TAG = ("A", "spawn")
+_HOP_A_TAG = ("A", "hop")
+_HYPERJUMP_A_TAG = ("A", "hyperjump")
+_SIDESTEP_A_TAG = ("A", "sidestep")
+
 
 def _sha256_hex(b: bytes) -> str:
     return hashlib.sha256(b).hexdigest()
@@ -20,7 +28,8 @@ def serialize_event_for_id(
     content: str,
 ) -> bytes:
     # NIP-01 canonical serialization: [0, pubkey, created_at, kind, tags, content]
-    payload = [0, pubkey_hex, created_at, kind, list(list(t) for t in tags), content]
+    # Lists/tuples are already JSON arrays; only copy other sequence types.
+    payload = [0, pubkey_hex, created_at, kind, [t if isinstance(t, (list, tuple)) else list(t) for t in tags], content]
     s = json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
     return s.encode("utf-8")
 
@@ -44,6 +53,31 @@ def compute_event_id_hex(
     )
 
 
+def compute_event_ids_hex_batch(events: Sequence[Dict[str, Any]]) -> List[str]:
+    """Compute NIP-01 ids for many events at once (e.g. replaying a chain).
+
+    The serialization always starts with `[0,<pubkey JSON>,`, so we prime one SHA-256
+    state per distinct pubkey and `.copy()` it for each event instead of re-hashing
+    the shared prefix every time.
+    """
+    primed: Dict[str, Any] = {}
+    out: List[str] = []
+    for ev in events:
+        pubkey_hex = ev["pubkey"]
+        h0 = primed.get(pubkey_hex)
+        if h0 is None:
+            # Encoded exactly as serialize_event_for_id would (escaping included).
+            h0 = hashlib.sha256(("[0," + json.dumps(pubkey_hex, ensure_ascii=False) + ",").encode("utf-8"))
+            primed[pubkey_hex] = h0
+        rest = [ev["created_at"], ev["kind"], ev["tags"], ev["content"]]
+        s = json.dumps(rest, separators=(",", ":"), ensure_ascii=False)
+        h = h0.copy()
+        # Drop the leading "[" of the tail list; the prefix already opened the array.
+        h.update(s[1:].encode("utf-8"))
+        out.append(h.hexdigest())
+    return out
+
+
 def new_event(
     *,
     pubkey_hex: str,
@@ -87,7 +121,7 @@ def _sector_tags_from_coord_hex(coord_hex: str) -> List[List[str]]:
 
 
 def make_spawn_event(*, pubkey_hex: str, created_at: int, coord_hex: str, kind: int = 3333) -> Dict[str, Any]:
-    tags: List[List[str]] = [["A", "spawn"], ["C", coord_hex]]
+    tags: List[Sequence[str]] = [_SPAWN_A_TAG, ["C", coord_hex]]
     tags.extend(_sector_tags_from_coord_hex(coord_hex))
     return new_event(pubkey_hex=pubkey_hex, created_at=created_at, kind=kind, tags=tags, content="")
 
@@ -103,8 +137,8 @@ def make_hyperjump_event(
     to_height: str,
     kind: int = 3333,
 ) -> Dict[str, Any]:
-    tags: List[List[str]] = [
-        ["A", "hyperjump"],
+    tags: List[Sequence[str]] = [
+        _HYPERJUMP_A_TAG,
         ["e", genesis_event_id, "", "genesis"],
         ["e", previous_event_id, "", "previous"],
         ["c", prev_coord_hex],
@@ -148,8 +182,8 @@ def make_hop_event(
     proof_hash_hex: str,
     kind: int = 3333,
 ) -> Dict[str, Any]:
-    tags: List[List[str]] = [
-        ["A", "hop"],
+    tags: List[Sequence[str]] = [
+        _HOP_A_TAG,
         ["e", genesis_event_id, "", "genesis"],
         ["e", previous_event_id, "", "previous"],
         ["c", prev_coord_hex],
@@ -185,8 +219,8 @@ def make_sidestep_event(
     lca_heights : (hx, hy, hz) tuple of per-axis LCA heights
     """
     hx, hy, hz = lca_heights
-    tags: List[List[str]] = [
-        ["A", "sidestep"],
+    tags: List[Sequence[str]] = [
+        _SIDESTEP_A_TAG,
         ["e", genesis_event_id, "", "genesis"],
         ["e", previous_event_id, "", "previous"],
         ["c", prev_coord_hex],
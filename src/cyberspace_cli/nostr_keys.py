@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import secrets
-from typing import Iterable, Optional, Tuple
+from typing import Iterable, List, Optional, Sequence, Tuple
 
 
 _CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
@@ -132,6 +132,20 @@ def pubkey_hex_from_privkey(privkey: bytes) -> str:
     return x_only.hex()
 
 
+def sign_events_batch(privkey: bytes, ids: Sequence[str]) -> List[str]:
+    """Schnorr-sign many 32-byte event ids (hex) with one key; returns sig hex strings.
+
+    The PrivateKey is parsed once and reused for the whole batch (e.g. chain replay).
+    """
+    PrivateKey = _require_coincurve_private_key()
+    pk = PrivateKey(privkey)
+    msgs = [bytes.fromhex(eid) for eid in ids]
+    for m in msgs:
+        if len(m) != 32:
+            raise ValueError("event id must be 32 bytes")
+    return [pk.sign_schnorr(m).hex() for m in msgs]
+
+
 def encode_nsec(privkey: bytes) -> str:
     data5 = convertbits(privkey, 8, 5, pad=True)
     if data5 is None:
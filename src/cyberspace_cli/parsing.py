@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 
-from cyberspace_core.coords import coord_to_xyz
+from cyberspace_core.coords import coord_to_xyz_from_bytes
+
+_HEX_DIGITS = re.compile(r"[0-9a-f]+")
 
 
 def normalize_hex_32(s: str) -> str:
@@ -22,11 +25,9 @@ def normalize_hex_32(s: str) -> str:
         raise ValueError("empty hex string")
     if len(s) > 64:
         raise ValueError("hex string too long (expected <= 32 bytes)")
-    # Validate hex
-    try:
-        int(s, 16)
-    except ValueError as e:
-        raise ValueError("invalid hex") from e
+    # Validate hex (digits only: int(s, 16) would also accept "_", "+", "-" and whitespace).
+    if _HEX_DIGITS.fullmatch(s) is None:
+        raise ValueError("invalid hex")
 
     # Left-pad to 32 bytes.
     return s.zfill(64)
@@ -72,6 +73,5 @@ def parse_destination_xyz_or_coord(value: str, *, default_plane: int) -> ParsedD
 
     # coord hex form
     h = normalize_hex_32(v)
-    coord_int = int.from_bytes(bytes.fromhex(h), "big")
-    x, y, z, plane = coord_to_xyz(coord_int)
+    x, y, z, plane = coord_to_xyz_from_bytes(bytes.fromhex(h))
     return ParsedDestination(x=x, y=y, z=z, plane=plane, kind="coord")
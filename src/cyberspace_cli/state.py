@@ -52,14 +52,16 @@ class CyberspaceState:
         )
 
     def to_dict(self) -> Dict[str, Any]:
+        # Keys are emitted in sorted order (including the nested target dicts) so
+        # save_state() can serialize without sort_keys and still produce a stable file.
         return {
-            "version": self.version,
-            "privkey_hex": self.privkey_hex,
-            "pubkey_hex": self.pubkey_hex,
-            "coord_hex": self.coord_hex,
             "active_chain_label": self.active_chain_label,
-            "targets": self.targets,
             "active_target_label": self.active_target_label,
+            "coord_hex": self.coord_hex,
+            "privkey_hex": self.privkey_hex,
+            "pubkey_hex": self.pubkey_hex,
+            "targets": [{k: t[k] for k in sorted(t)} for t in self.targets],
+            "version": self.version,
         }
 
 
@@ -76,7 +78,8 @@ def save_state(state: CyberspaceState, path: Optional[Path] = None) -> None:
     p = path or default_state_path()
     p.parent.mkdir(parents=True, exist_ok=True)
     tmp = p.with_suffix(p.suffix + ".tmp")
+    # One dumps() + one write instead of json.dump()'s many small writes.
+    data = json.dumps(state.to_dict(), indent=2)
     with tmp.open("w", encoding="utf-8") as f:
-        json.dump(state.to_dict(), f, indent=2, sort_keys=True)
-        f.write("\n")
+        f.write(data + "\n")
     tmp.replace(p)
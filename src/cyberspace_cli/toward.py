@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import List, Sequence, Tuple
 
 from cyberspace_core.coords import AXIS_MAX
 from cyberspace_core.movement import find_lca_height
@@ -73,3 +74,49 @@ def choose_next_hop_xyz(*, x: int, y: int, z: int, tx: int, ty: int, tz: int, ma
         y=choose_next_axis_value_toward(current=y, target=ty, max_lca_height=max_lca_height),
         z=choose_next_axis_value_toward(current=z, target=tz, max_lca_height=max_lca_height),
     )
+
+
+def choose_next_hop_xyz_batch(
+    current: Sequence[Tuple[int, int, int]],
+    target: Sequence[Tuple[int, int, int]],
+    *,
+    max_lca_height: int,
+) -> List[Tuple[int, int, int]]:
+    """Next (x,y,z) for many agents at once; same rule as `choose_next_hop_xyz`.
+
+    Returns only the next coordinates (no StepResults). Raises ValueError under the same
+    conditions as the scalar path, i.e. when some axis cannot progress under the bound.
+    """
+    if len(current) != len(target):
+        raise ValueError("current and target must have the same length")
+
+    # Axis values are up to 85 bits, so this stays on Python ints rather than int64 arrays.
+    # The block bounds are the same masks for every axis; only the clamp is per value.
+    if max_lca_height <= 0:
+        if any(tuple(c) != tuple(t) for c, t in zip(current, target)):
+            raise ValueError("max_lca_height must be >= 1 to make progress")
+        return [tuple(c) for c in current]
+
+    span = (1 << max_lca_height) - 1
+    hi = ~span
+
+    def step(cur: int, tgt: int) -> int:
+        if cur == tgt:
+            return cur
+        base = cur & hi
+        if tgt < base:
+            nxt = base
+        elif tgt > base + span:
+            nxt = base + span
+        else:
+            nxt = tgt
+        if nxt == cur:
+            raise ValueError(f"cannot progress from {cur} toward {tgt} with max_lca_height={max_lca_height}")
+        if not (0 <= nxt <= AXIS_MAX):
+            raise ValueError("next value out of axis range")
+        return nxt
+
+    return [
+        (step(x, tx), step(y, ty), step(z, tz))
+        for (x, y, z), (tx, ty, tz) in zip(current, target)
+    ]
@@ -2,24 +2,100 @@ from __future__ import annotations
 
 import sys
 import tkinter as tk
-from dataclasses import dataclass
-from decimal import Decimal
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from tkinter import ttk
-from typing import Optional
+from typing import List, Optional, Tuple
 
-import matplotlib
+from cyberspace_cli.parsing import normalize_hex_32
+from cyberspace_core.coords import gps_to_dataspace_coord
+from cyberspace_core.sector import SECTOR_BITS_DEFAULT, coord_to_sector_id, coord_to_sector_local_centered
 
-# TkAgg gives us an embedded window + copyable text in a minimal way.
-matplotlib.use("TkAgg")
+from .viz import (
+    Marker,
+    SceneConfig,
+    build_scene,
+    build_sector_scene,
+    coord_to_dataspace_km,
+    golden_vector_markers,
+    update_marker_artists,
+)
 
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk  # noqa: E402
-from matplotlib.figure import Figure  # noqa: E402
 
-from cyberspace_cli.parsing import normalize_hex_32
-from cyberspace_core.coords import coord_to_xyz, gps_to_dataspace_coord
-from cyberspace_core.sector import SECTOR_BITS_DEFAULT, coord_to_sector_id, coord_to_sector_local_centered
+# Hex strings are parsed once (when spawn/current are set); the decode caches below are
+# keyed on the parsed int so repeat renders, view resets and sector framing skip the
+# normalize/fromhex/from_bytes round trip entirely.
+@lru_cache(maxsize=64)
+def _coord_hex_to_int(coord_hex: str) -> int:
+    return int.from_bytes(bytes.fromhex(normalize_hex_32(coord_hex)), "big")
+
+
+def _coord_hex_to_int_or_none(coord_hex: str) -> Optional[int]:
+    if not coord_hex:
+        return None
+    try:
+        return _coord_hex_to_int(coord_hex)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=64)
+def _coord_int_to_sector_id(coord: int, sector_bits: int):
+    sid, _plane = coord_to_sector_id(coord=coord, sector_bits=sector_bits)
+    return sid
+
+
+@lru_cache(maxsize=64)
+def _coord_int_to_posplane(
+    coord: int, sector_bits: Optional[int]
+) -> Tuple[Tuple[float, float, float], int]:
+    """Decode a coord into (scene position, plane).
+
+    With `sector_bits` set, the position is sector-local in [-0.5, +0.5); otherwise it is
+    dataspace km from center.
+    """
+    plane = coord & 1
+    if sector_bits is not None:
+        _sid, _plane2, local = coord_to_sector_local_centered(coord=coord, sector_bits=sector_bits)
+        return local, plane
+    return coord_to_dataspace_km(coord), plane
+
+
+# Marker label suffix by plane bit, so building a marker is a plain concatenation.
+_PLANE_SUFFIX = (" (plane=0)", " (plane=1)")
+
+
+@lru_cache(maxsize=256)
+def _coord_int_to_hex(coord: int) -> str:
+    """Format a 256-bit coord as 0x-prefixed 64-char hex (cached for repeat renders)."""
+    return "0x" + coord.to_bytes(32, "big").hex()
+
+
+# matplotlib's TkAgg backend is imported on first use by _load_tk_backend(), so importing
+# this module (e.g. for `main`'s argv parsing) doesn't pay matplotlib's import cost.
+FigureCanvasTkAgg = None
+NavigationToolbar2Tk = None
+Figure = None
+
 
-from .viz import Marker, SceneConfig, coord_to_dataspace_km, draw_scene, draw_sector_scene, golden_vector_markers
+def _load_tk_backend() -> None:
+    """Import matplotlib's TkAgg backend into module globals (idempotent)."""
+    global FigureCanvasTkAgg, NavigationToolbar2Tk, Figure
+    if Figure is not None:
+        return
+
+    import matplotlib
+
+    # TkAgg gives us an embedded window + copyable text in a minimal way.
+    matplotlib.use("TkAgg")
+
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg as _FigureCanvasTkAgg
+    from matplotlib.backends.backend_tkagg import NavigationToolbar2Tk as _NavigationToolbar2Tk
+    from matplotlib.figure import Figure as _Figure
+
+    FigureCanvasTkAgg = _FigureCanvasTkAgg
+    NavigationToolbar2Tk = _NavigationToolbar2Tk
+    Figure = _Figure
 
 
 @dataclass
@@ -31,6 +107,33 @@ class CyberspaceVisualizerApp:
     FACE_BLACK_SUN_ELEV_DEG = 15.0
     FACE_BLACK_SUN_AZIM_DEG = -90.0
     DEFAULT_EARTH_VIEW_ALTITUDE_KM = 12000.0
+    RENDER_DEBOUNCE_MS = 50
+    DRAW_THROTTLE_MS = 16  # ~60 Hz cap on full canvas draws
+
+    # Major-city presets (mirrors GPS test vectors): name -> (lat_str, lon_str, lat, lon).
+    # The strings are what the entry fields show, so selecting a preset formats nothing.
+    CITY_PRESETS = {
+        name: (lat, lon, float(lat), float(lon))
+        for name, lat, lon in (
+            ("New York City", "40.7128", "-74.0060"),
+            ("San Francisco", "37.7749", "-122.4194"),
+            ("London", "51.5074", "-0.1278"),
+            ("Tokyo", "35.6895", "139.6917"),
+            ("Sydney", "-33.8688", "151.2093"),
+            ("Singapore", "1.3521", "103.8198"),
+            ("Dubai", "25.2048", "55.2708"),
+            ("Mumbai", "19.0760", "72.8777"),
+            # ASCII label to avoid any potential Tk font/locale weirdness.
+            ("Sao Paulo", "-23.5505", "-46.6333"),
+            ("Cape Town", "-33.9249", "18.4241"),
+        )
+    }
+
+    # Logical figure size/dpi. TkAgg applies the device pixel ratio (from `tk scaling`) on
+    # top of this itself, so deriving dpi from the screen here would scale twice.
+    FIGURE_SIZE_IN = (7.6, 6.2)
+    FIGURE_DPI = 100
+
     def __init__(
         self,
         root: tk.Tk,
@@ -44,6 +147,7 @@ class CyberspaceVisualizerApp:
         sector_bits: int = SECTOR_BITS_DEFAULT,
     ) -> None:
         self.root = root
+        _load_tk_backend()
 
         self.mode = (mode or "dataspace").strip().lower()
         if self.mode not in ("dataspace", "sector"):
@@ -58,10 +162,14 @@ class CyberspaceVisualizerApp:
 
         self.spawn_coord_hex = initial_spawn_coord_hex or ""
         self.current_coord_hex = initial_current_coord_hex or ""
+        # Parsed once here; None when unset or invalid (the render reports the parse error).
+        self.spawn_coord_int = _coord_hex_to_int_or_none(self.spawn_coord_hex)
+        self.current_coord_int = _coord_hex_to_int_or_none(self.current_coord_hex)
 
         # --- Controls (scrollable) ---
+        # The shell is only packed (and the controls frame only embedded in the canvas) once
+        # every child exists, so Tk lays the panel out in one pass rather than per widget.
         controls_shell = ttk.Frame(root)
-        controls_shell.pack(side=tk.LEFT, fill=tk.Y)
 
         self.controls_canvas = tk.Canvas(controls_shell, highlightthickness=0, borderwidth=0, width=390)
         self.controls_scrollbar = ttk.Scrollbar(controls_shell, orient=tk.VERTICAL, command=self.controls_canvas.yview)
@@ -70,7 +178,6 @@ class CyberspaceVisualizerApp:
         self.controls_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
         controls = ttk.Frame(self.controls_canvas, padding=10)
-        self.controls_window_id = self.controls_canvas.create_window((0, 0), window=controls, anchor="nw")
         self.controls_canvas.bind("<Configure>", self._on_controls_canvas_configure)
         controls.bind("<Configure>", self._on_controls_frame_configure)
 
@@ -100,20 +207,12 @@ class CyberspaceVisualizerApp:
 
         ttk.Label(controls, text="GPS Input", font=("TkDefaultFont", 12, "bold")).pack(anchor="w")
 
-        # Major-city presets (mirrors GPS test vectors)
-        self.city_presets = {
-            "New York City": (40.7128, -74.0060),
-            "San Francisco": (37.7749, -122.4194),
-            "London": (51.5074, -0.1278),
-            "Tokyo": (35.6895, 139.6917),
-            "Sydney": (-33.8688, 151.2093),
-            "Singapore": (1.3521, 103.8198),
-            "Dubai": (25.2048, 55.2708),
-            "Mumbai": (19.0760, 72.8777),
-            # ASCII label to avoid any potential Tk font/locale weirdness.
-            "Sao Paulo": (-23.5505, -46.6333),
-            "Cape Town": (-33.9249, 18.4241),
-        }
+        self.city_presets = self.CITY_PRESETS
+        # Presets are fixed, so convert them once up front (surface clamp, alt=0).
+        self._city_coord_cache: dict[str, tuple[int, str]] = {}
+        for name, (lat_str, lon_str, _lat, _lon) in self.city_presets.items():
+            coord = gps_to_dataspace_coord(lat_str, lon_str, "0", clamp_to_surface=True)
+            self._city_coord_cache[name] = (coord, _coord_int_to_hex(coord))
 
         self.city_var = tk.StringVar(value="Custom")
         ttk.Label(controls, text="City preset").pack(anchor="w", pady=(6, 0))
@@ -175,14 +274,16 @@ class CyberspaceVisualizerApp:
         self._bind_controls_mousewheel_tree(controls)
         self._bind_controls_mousewheel(self.controls_canvas)
 
+        self.controls_window_id = self.controls_canvas.create_window((0, 0), window=controls, anchor="nw")
         # Ensure initial scroll bounds are correct.
         self._on_controls_frame_configure()
+        controls_shell.pack(side=tk.LEFT, fill=tk.Y)
 
         # --- Figure ---
         fig_frame = ttk.Frame(root, padding=10)
         fig_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
 
-        self.fig = Figure(figsize=(7.6, 6.2), dpi=100)
+        self.fig = Figure(figsize=self.FIGURE_SIZE_IN, dpi=self.FIGURE_DPI)
         self.ax = self.fig.add_subplot(111, projection="3d")
 
         self.canvas = FigureCanvasTkAgg(self.fig, master=fig_frame)
@@ -193,6 +294,23 @@ class CyberspaceVisualizerApp:
         self.toolbar.update()
         self.toolbar.pack(side=tk.BOTTOM, fill=tk.X)
 
+        # Blitting: the static scene (grid/earth/axes) is drawn normally and cached as a
+        # background after every full draw; markers are animated artists blitted on top.
+        self._bg = None
+        # Pooled (shape, scatter, text) marker slots, updated in place between full draws.
+        self._marker_artists: list = []
+        self._static_key = None
+        # (cfg, markers, sector_label) of the last render, to skip no-op re-renders.
+        self._last_render_key = None
+        self._home_limits = None
+        self._static_dirty = True
+        self._pending_render_id = None
+        self._draw_pending = False
+        self._draw_timer_id = None
+        self.canvas.mpl_connect("draw_event", self._on_canvas_draw)
+        for var in (self.scale_var, self.grid_lines_var, self.show_midplane_var):
+            var.trace_add("write", self._mark_static_dirty)
+
         self.last_markers = []
         self.show_golden_vectors = False
         self.golden_markers = golden_vector_markers()
@@ -315,19 +433,115 @@ class CyberspaceVisualizerApp:
             raise ValueError("Earth view altitude must be >= 0 km.")
         return altitude_km
 
-    def _render_scene(self, *, markers, sector_label: str = "") -> None:
+    def _mark_static_dirty(self, *_args) -> None:
+        self._static_dirty = True
+
+    def _on_canvas_draw(self, _evt=None) -> None:
+        # Any full draw (ours, a resize, or a mouse rotation) invalidates the cached
+        # background; recapture it and put the animated markers back on top.
+        self._bg = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_marker_artists()
+
+    def _draw_marker_artists(self) -> None:
+        for _shape, sc, txt in self._marker_artists:
+            if sc.get_visible():
+                sc.do_3d_projection()
+                self.ax.draw_artist(sc)
+            if txt.get_visible():
+                self.ax.draw_artist(txt)
+
+    def _render_scene(self, *, markers, sector_label: str = "", reset_camera: bool = False) -> None:
+        """Render markers over the static scene, rebuilding the scene only when needed.
+
+        Camera angles are not part of the static key: with `reset_camera=True` and an
+        unchanged scene, the view and home limits are re-applied and the existing artists
+        are redrawn instead of rebuilt. A render identical to the last one (same config,
+        markers and sector) is skipped; the canvas already shows it.
+        """
         cfg = self._get_scene_config()
         base_markers = list(markers or [])
         scene_markers = list(base_markers)
         if self.mode == "dataspace" and self.show_golden_vectors:
             scene_markers.extend(self.golden_markers)
-        if self.mode == "sector":
-            draw_sector_scene(self.ax, cfg=cfg, markers=scene_markers, sector_label=sector_label)
-        else:
-            draw_scene(self.ax, cfg=cfg, markers=scene_markers)
-        self.canvas.draw_idle()
+
+        render_key = (cfg, tuple(scene_markers), sector_label)
+        static_key = (replace(cfg, elev_deg=0.0, azim_deg=0.0), sector_label)
+        if not (self._static_dirty or static_key != self._static_key) and reset_camera:
+            # Camera only: restore the view/limits build_*() set, then one full draw.
+            self.ax.view_init(elev=cfg.elev_deg, azim=cfg.azim_deg)
+            xlim, ylim, zlim = self._home_limits
+            self.ax.set_xlim3d(xlim)
+            self.ax.set_ylim3d(ylim)
+            self.ax.set_zlim3d(zlim)
+            self._marker_artists = update_marker_artists(
+                self.ax, self._marker_artists, cfg=cfg, markers=scene_markers
+            )
+            self._bg = None
+            self._request_draw()
+        elif self._static_dirty or static_key != self._static_key:
+            # Static scene changed: rebuild it (this clears the axes, markers included).
+            if self.mode == "sector":
+                build_sector_scene(self.ax, cfg=cfg, sector_label=sector_label)
+            else:
+                build_scene(self.ax, cfg=cfg)
+            # The rebuild cleared the axes, so the old marker slots are gone with it.
+            self._marker_artists = update_marker_artists(self.ax, [], cfg=cfg, markers=scene_markers)
+            self._home_limits = (self.ax.get_xlim3d(), self.ax.get_ylim3d(), self.ax.get_zlim3d())
+            self._static_key = static_key
+            self._static_dirty = False
+            self._bg = None
+            self._request_draw()
+        elif render_key != self._last_render_key:
+            # Markers only: restore the cached background and blit the new markers.
+            self._marker_artists = update_marker_artists(
+                self.ax, self._marker_artists, cfg=cfg, markers=scene_markers
+            )
+            if self._bg is None:
+                # No background captured yet (a full draw is pending): the draw_event
+                # handler blits the updated markers once it lands.
+                self._request_draw()
+            else:
+                self.canvas.restore_region(self._bg)
+                self._draw_marker_artists()
+                self.canvas.blit(self.fig.bbox)
+        self._last_render_key = render_key
         self.last_markers = base_markers
 
+    def _request_draw(self) -> None:
+        """Coalesce full canvas draws into at most one per DRAW_THROTTLE_MS."""
+        self._draw_pending = True
+        if self._draw_timer_id is None:
+            self._draw_timer_id = self.root.after(self.DRAW_THROTTLE_MS, self._flush_draw)
+
+    def _flush_draw(self) -> None:
+        self._draw_timer_id = None
+        if not self._draw_pending:
+            return
+        self._draw_pending = False
+        self.canvas.draw_idle()
+
+    def _request_render(self, *, markers, sector_label: str = "", status: str = "") -> None:
+        """Schedule a render in RENDER_DEBOUNCE_MS, replacing any render still pending.
+
+        Bursts of button presses collapse into a single render of the latest markers.
+        `status` is shown once that render has actually run.
+        """
+        if self._pending_render_id is not None:
+            self.root.after_cancel(self._pending_render_id)
+        self._pending_render_id = self.root.after(
+            self.RENDER_DEBOUNCE_MS, self._flush_pending_render, list(markers or []), sector_label, status
+        )
+
+    def _flush_pending_render(self, markers, sector_label: str, status: str) -> None:
+        self._pending_render_id = None
+        try:
+            self._render_scene(markers=markers, sector_label=sector_label)
+        except Exception as e:
+            self._set_status(f"Error: {e}")
+            return
+        if status:
+            self._set_status(status)
+
     def _update_text_widget(self, widget: tk.Text, value: str) -> None:
         widget.configure(state="normal")
         widget.delete("1.0", tk.END)
@@ -340,91 +554,101 @@ class CyberspaceVisualizerApp:
         self._update_text_widget(self.spawn_text, spawn)
         self._update_text_widget(self.current_text, cur)
 
-    def _parse_coord_hex_to_marker(self, coord_hex: str, *, color: str, label: str) -> Marker:
-        h = normalize_hex_32(coord_hex)
-        coord_int = int.from_bytes(bytes.fromhex(h), "big")
-        _x, _y, _z, plane = coord_to_xyz(coord_int)
-
-        if self.mode == "sector":
-            _sid, _plane2, (lx, ly, lz) = coord_to_sector_local_centered(coord=coord_int, sector_bits=self.sector_bits)
-            # Keep the Marker dataclass unchanged; in sector mode position is normalized scene units.
-            return Marker(position_km=(lx, ly, lz), color=color, label=f"{label} (plane={plane})")
-
-        pos_km = coord_to_dataspace_km(coord_int)
-        return Marker(position_km=pos_km, color=color, label=f"{label} (plane={plane})")
+    def _anchor_coord_int(self) -> Optional[int]:
+        # Sector framing always uses the current coord if present (even if hidden),
+        # falling back to spawn if that's all we have.
+        if self.current_coord_int is not None:
+            return self.current_coord_int
+        return self.spawn_coord_int
+
+    def _anchor_sector_label(self) -> str:
+        anchor = self._anchor_coord_int()
+        if self.mode != "sector" or anchor is None:
+            return ""
+        return _coord_int_to_sector_id(anchor, self.sector_bits).tag()
+
+    def _int_to_marker(self, coord_int: int, *, color: str, label: str) -> Marker:
+        sector_bits = self.sector_bits if self.mode == "sector" else None
+        pos, plane = _coord_int_to_posplane(coord_int, sector_bits)
+        # In sector mode position is normalized scene units (Marker dataclass unchanged).
+        return Marker(position_km=pos, color=color, label=label + _PLANE_SUFFIX[plane])
 
     def on_city_selected(self, _evt=None) -> None:
         city = self.city_var.get().strip()
         if not city or city == "Custom":
             return
 
-        def apply_city() -> None:
-            try:
-                if city not in self.city_presets:
-                    return
-                lat, lon = self.city_presets[city]
-                self.lat_var.set(str(lat))
-                self.lon_var.set(str(lon))
-                self._set_status(f"Preset: {city}")
-            except Exception as e:
-                self._set_status(f"Error applying preset: {e}")
-
-        self.root.after(0, apply_city)
+        # Already on the Tk main thread (<<ComboboxSelected>>), so apply directly.
+        try:
+            if city not in self.city_presets:
+                return
+            lat_str, lon_str, _lat, _lon = self.city_presets[city]
+            self.lat_var.set(lat_str)
+            self.lon_var.set(lon_str)
+            self._set_status(f"Preset: {city}")
+        except Exception as e:
+            self._set_status(f"Error applying preset: {e}")
 
-    def on_render_spawn_current(self) -> None:
+    def _build_markers(self) -> Tuple[List[Marker], List[str], str]:
+        """Markers for the visible spawn/current coords, per-marker errors, and sector label."""
         markers = []
         errors = []
 
         sector_label = ""
         anchor_sid = None
-        if self.mode == "sector":
-            # Sector framing always uses the current coord if present (even if hidden),
-            # falling back to spawn if that's all we have.
-            anchor_hex = (self.current_coord_hex or "") or (self.spawn_coord_hex or "")
-            if anchor_hex:
-                try:
-                    h = normalize_hex_32(anchor_hex)
-                    coord_int = int.from_bytes(bytes.fromhex(h), "big")
-                    anchor_sid, _plane = coord_to_sector_id(coord=coord_int, sector_bits=self.sector_bits)
-                    sector_label = anchor_sid.tag()
-                except Exception:
-                    anchor_sid = None
-                    sector_label = ""
+        anchor = self._anchor_coord_int()
+        if self.mode == "sector" and anchor is not None:
+            anchor_sid = _coord_int_to_sector_id(anchor, self.sector_bits)
+            sector_label = anchor_sid.tag()
 
         if self.show_spawn_var.get() and self.spawn_coord_hex:
             try:
+                if self.spawn_coord_int is None:
+                    _coord_hex_to_int(self.spawn_coord_hex)  # raises the parse error
                 if self.mode == "sector" and anchor_sid is not None:
-                    h = normalize_hex_32(self.spawn_coord_hex)
-                    spawn_int = int.from_bytes(bytes.fromhex(h), "big")
-                    spawn_sid, _plane = coord_to_sector_id(coord=spawn_int, sector_bits=self.sector_bits)
+                    spawn_sid = _coord_int_to_sector_id(self.spawn_coord_int, self.sector_bits)
                     if spawn_sid != anchor_sid:
                         errors.append(f"spawn: different sector (S={spawn_sid.tag()})")
                     else:
-                        markers.append(self._parse_coord_hex_to_marker(self.spawn_coord_hex, color="#00FF88", label="spawn"))
+                        markers.append(self._int_to_marker(self.spawn_coord_int, color="#00FF88", label="spawn"))
                 else:
-                    markers.append(self._parse_coord_hex_to_marker(self.spawn_coord_hex, color="#00FF88", label="spawn"))
+                    markers.append(self._int_to_marker(self.spawn_coord_int, color="#00FF88", label="spawn"))
             except Exception as e:
                 errors.append(f"spawn: {e}")
 
         if self.show_current_var.get() and self.current_coord_hex:
             try:
-                markers.append(self._parse_coord_hex_to_marker(self.current_coord_hex, color="#FF0000", label="current"))
+                if self.current_coord_int is None:
+                    _coord_hex_to_int(self.current_coord_hex)  # raises the parse error
+                markers.append(self._int_to_marker(self.current_coord_int, color="#FF0000", label="current"))
             except Exception as e:
                 errors.append(f"current: {e}")
 
+        return markers, errors, sector_label
+
+    def on_render_spawn_current(self) -> None:
+        markers, errors, sector_label = self._build_markers()
+
         if not markers:
             msg = "No spawn/current coords to render."
             if errors:
                 msg += " (" + "; ".join(errors) + ")"
-            self._set_status(msg)
-            self._render_scene(markers=[], sector_label=sector_label)
-            return
-
-        self._render_scene(markers=markers, sector_label=sector_label)
-        if errors:
-            self._set_status("Rendered with warnings: " + "; ".join(errors))
+        elif errors:
+            msg = "Rendered with warnings: " + "; ".join(errors)
         else:
-            self._set_status("Rendered spawn/current.")
+            msg = "Rendered spawn/current."
+        self._request_render(markers=markers, sector_label=sector_label, status=msg)
+
+    def _preset_coord(self, lat: str, lon: str, clamp_to_surface: bool) -> Optional[Tuple[int, str]]:
+        """Cached coord for the selected preset, if the GPS fields still match it."""
+        city = self.city_var.get().strip()
+        cached = self._city_coord_cache.get(city)
+        if cached is None or not clamp_to_surface:
+            return None
+        lat_str, lon_str, _lat, _lon = self.city_presets[city]
+        if (lat, lon) != (lat_str, lon_str):
+            return None
+        return cached
 
     def on_render_gps(self) -> None:
         try:
@@ -435,22 +659,26 @@ class CyberspaceVisualizerApp:
             # Treat alt=0 (including "0.0", "0e0", etc) as the default surface clamp.
             clamp_to_surface = False
             try:
-                clamp_to_surface = Decimal(alt) == Decimal(0)
-            except Exception:
+                clamp_to_surface = float(alt) == 0.0
+            except ValueError:
                 clamp_to_surface = True
 
-            coord = gps_to_dataspace_coord(lat, lon, alt, clamp_to_surface=clamp_to_surface)
-            coord_hex = "0x" + coord.to_bytes(32, "big").hex()
+            cached = self._preset_coord(lat, lon, clamp_to_surface)
+            if cached is not None:
+                coord, coord_hex = cached
+            else:
+                coord = gps_to_dataspace_coord(lat, lon, alt, clamp_to_surface=clamp_to_surface)
+                coord_hex = _coord_int_to_hex(coord)
 
             self.current_coord_hex = coord_hex
+            self.current_coord_int = coord
             self.coord_in_var.set(coord_hex)
             self._update_cli_coord_texts()
 
             # Render with spawn (optional)
-            self.on_render_spawn_current()
+            markers, _errors, sector_label = self._build_markers()
+            self._request_render(markers=markers, sector_label=sector_label, status="Rendered GPS coordinate.")
             self._update_text_widget(self.coord_out_text, coord_hex)
-
-            self._set_status("Rendered GPS coordinate.")
         except Exception as e:
             self._set_status(f"Error: {e}")
 
@@ -462,11 +690,13 @@ class CyberspaceVisualizerApp:
                 return
 
             # This becomes our "current".
+            coord = _coord_hex_to_int(coord_hex)
             self.current_coord_hex = coord_hex
+            self.current_coord_int = coord
             self._update_cli_coord_texts()
-            self.on_render_spawn_current()
+            markers, _errors, sector_label = self._build_markers()
+            self._request_render(markers=markers, sector_label=sector_label, status="Rendered coord hex.")
             self._update_text_widget(self.coord_out_text, coord_hex)
-            self._set_status("Rendered coord hex.")
         except Exception as e:
             self._set_status(f"Error: {e}")
 
@@ -481,19 +711,9 @@ class CyberspaceVisualizerApp:
             self.elev_deg = self.FACE_BLACK_SUN_ELEV_DEG
             self.azim_deg = self.FACE_BLACK_SUN_AZIM_DEG
 
-        sector_label = ""
-        if self.mode == "sector":
-            anchor_hex = (self.current_coord_hex or "") or (self.spawn_coord_hex or "")
-            if anchor_hex:
-                try:
-                    h = normalize_hex_32(anchor_hex)
-                    coord_int = int.from_bytes(bytes.fromhex(h), "big")
-                    sid, _plane = coord_to_sector_id(coord=coord_int, sector_bits=self.sector_bits)
-                    sector_label = sid.tag()
-                except Exception:
-                    sector_label = ""
-
-        self._render_scene(markers=self.last_markers, sector_label=sector_label)
+        sector_label = self._anchor_sector_label()
+
+        self._render_scene(markers=self.last_markers, sector_label=sector_label, reset_camera=True)
         self._set_status("View reset.")
 
     def on_view_earth(self) -> None:
@@ -510,32 +730,22 @@ class CyberspaceVisualizerApp:
             return
 
         self.earth_view_enabled = True
-        self._render_scene(markers=self.last_markers, sector_label="")
+        self._render_scene(markers=self.last_markers, sector_label="", reset_camera=True)
         self._set_status(f"View Earth enabled (altitude: {self.earth_view_altitude_km:g} km).")
 
     def on_face_black_sun(self) -> None:
         """Set a deterministic view that faces the black sun (+Z / east)."""
         self._ensure_rotate_mode()
 
-        # In draw_scene(), Cyberspace axes are mapped to mpl as:
+        # In build_scene(), Cyberspace axes are mapped to mpl as:
         #   (X_cs, Y_cs, Z_cs) -> (X_mpl, Y_mpl, Z_mpl) = (X_cs, Z_cs, Y_cs)
         # So to look toward +Z_cs (east / black sun), view from -Y_mpl.
         self.elev_deg = self.FACE_BLACK_SUN_ELEV_DEG
         self.azim_deg = self.FACE_BLACK_SUN_AZIM_DEG
 
-        sector_label = ""
-        if self.mode == "sector":
-            anchor_hex = (self.current_coord_hex or "") or (self.spawn_coord_hex or "")
-            if anchor_hex:
-                try:
-                    h = normalize_hex_32(anchor_hex)
-                    coord_int = int.from_bytes(bytes.fromhex(h), "big")
-                    sid, _plane = coord_to_sector_id(coord=coord_int, sector_bits=self.sector_bits)
-                    sector_label = sid.tag()
-                except Exception:
-                    sector_label = ""
-
-        self._render_scene(markers=self.last_markers, sector_label=sector_label)
+        sector_label = self._anchor_sector_label()
+
+        self._render_scene(markers=self.last_markers, sector_label=sector_label, reset_camera=True)
         self._set_status("View: facing black sun (+Z east).")
 
     def on_toggle_golden_vectors(self) -> None:
@@ -576,6 +786,8 @@ def run_app(
     mode: str = "dataspace",
     sector_bits: int = SECTOR_BITS_DEFAULT,
 ) -> int:
+    # Load the backend before opening a window so missing GUI deps fail fast.
+    _load_tk_backend()
     root = tk.Tk()
     _ = CyberspaceVisualizerApp(
         root,
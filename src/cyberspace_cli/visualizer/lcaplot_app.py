@@ -1,20 +1,72 @@
 from __future__ import annotations
 
+import queue
 import sys
+import threading
 import tkinter as tk
 from dataclasses import dataclass
 from tkinter import ttk
 from typing import Optional
 
-import matplotlib
+import numpy as np
 
-# TkAgg gives us an embedded window + editable controls.
-matplotlib.use("TkAgg")
+from cyberspace_cli.lcaplot import block_boundary_offsets, compute_adjacent_lca_heights
 
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk  # noqa: E402
-from matplotlib.figure import Figure  # noqa: E402
+# matplotlib's TkAgg backend is imported on first use by _load_tk_backend(), so importing
+# this module (e.g. for `main`'s argv parsing) doesn't pay matplotlib's import cost.
+FigureCanvasTkAgg = None
+NavigationToolbar2Tk = None
+Figure = None
+LineCollection = None
 
-from cyberspace_cli.lcaplot import block_boundary_offsets, compute_adjacent_lca_heights
+# Spans at least this wide are computed off the Tk thread (~20 ms and up).
+_THREADED_MIN_SPAN = 100_000
+# How often the Tk thread checks for finished background computes.
+_RESULT_POLL_MS = 20
+
+
+def _load_tk_backend() -> None:
+    """Import matplotlib's TkAgg backend into module globals (idempotent)."""
+    global FigureCanvasTkAgg, NavigationToolbar2Tk, Figure, LineCollection
+    if Figure is not None:
+        return
+
+    import matplotlib
+
+    # TkAgg gives us an embedded window + editable controls.
+    matplotlib.use("TkAgg")
+
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg as _FigureCanvasTkAgg
+    from matplotlib.backends.backend_tkagg import NavigationToolbar2Tk as _NavigationToolbar2Tk
+    from matplotlib.collections import LineCollection as _LineCollection
+    from matplotlib.figure import Figure as _Figure
+
+    FigureCanvasTkAgg = _FigureCanvasTkAgg
+    NavigationToolbar2Tk = _NavigationToolbar2Tk
+    LineCollection = _LineCollection
+    Figure = _Figure
+
+
+def _minmax_envelope(xs, ys, buckets: int):
+    """Decimate a series to a min/max envelope of about `2 * buckets` vertices.
+
+    Each bucket of consecutive points becomes a vertical stroke from its min to its max
+    (the waveform-display trick), so single-point spikes survive the downsampling.
+    """
+
+    x = np.asarray(xs)
+    y = np.asarray(ys)
+    per = len(y) // buckets
+    n_full = per * buckets
+    y_full = y[:n_full].reshape(buckets, per)
+    lo = y_full.min(axis=1)
+    hi = y_full.max(axis=1)
+    bx = x[:n_full:per]
+    if n_full < len(y):
+        lo = np.append(lo, y[n_full:].min())
+        hi = np.append(hi, y[n_full:].max())
+        bx = np.append(bx, x[n_full])
+    return np.repeat(bx, 2), np.column_stack((lo, hi)).ravel()
 
 
 @dataclass
@@ -37,6 +89,8 @@ class LCAPlotApp:
         current_z: Optional[int] = None,
     ) -> None:
         self.root = root
+        _load_tk_backend()
+
         root.title("Cyberspace LCA Plot")
         root.geometry("1150x740")
 
@@ -85,7 +139,8 @@ class LCAPlotApp:
 
         btn_row = ttk.Frame(controls)
         btn_row.pack(fill=tk.X, pady=(10, 0))
-        ttk.Button(btn_row, text="Render", command=self.on_render).pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.render_button = ttk.Button(btn_row, text="Render", command=self.on_render)
+        self.render_button.pack(side=tk.LEFT, fill=tk.X, expand=True)
         ttk.Button(btn_row, text="Reset", command=self.on_reset).pack(side=tk.LEFT, padx=(6, 0))
 
         if any(v is not None for v in self.current_xyz.values()):
@@ -105,6 +160,19 @@ class LCAPlotApp:
         self.fig = Figure(figsize=(7.6, 6.2), dpi=100)
         self.ax = self.fig.add_subplot(111)
 
+        # Persistent artists: renders only swap their data instead of clearing the axes.
+        self._line, = self.ax.plot([], [], linewidth=1.0)
+        self._href = self.ax.axhline(0, color="#cc0000", linestyle="--", linewidth=1.0, alpha=0.8)
+        # Boundaries: x in data coords, y spans the axes (same placement as axvline,
+        # without an artist per line).
+        self._boundary_coll = LineCollection(
+            [], linewidths=0.8, alpha=0.25, transform=self.ax.get_xaxis_transform()
+        )
+        self.ax.add_collection(self._boundary_coll, autolim=False)
+        self.ax.set_xlabel("offset from center (v - center)")
+        self.ax.set_ylabel("lca_height(v, v±1)")
+        self.ax.grid(True, alpha=0.25)
+
         self.canvas = FigureCanvasTkAgg(self.fig, master=fig_frame)
         self.canvas_widget = self.canvas.get_tk_widget()
         self.canvas_widget.pack(fill=tk.BOTH, expand=True)
@@ -113,6 +181,16 @@ class LCAPlotApp:
         self.toolbar.update()
         self.toolbar.pack(side=tk.BOTTOM, fill=tk.X)
 
+        # Renders requested while one is already queued collapse into it.
+        self._render_pending = False
+        # Bumped per render so a slow background compute can't overwrite a newer plot.
+        self._render_generation = 0
+        # Workers never touch Tk: they post (params, series, error) here and the Tk thread
+        # drains it from a root.after poll.
+        self._results: queue.Queue = queue.Queue()
+        self._workers_in_flight = 0
+        self._poll_id = None
+
         # Bind enter to render.
         root.bind("<Return>", lambda _evt: self.on_render())
 
@@ -154,50 +232,126 @@ class LCAPlotApp:
         self.on_render()
 
     def on_render(self) -> None:
+        """Schedule a render once the Tk event queue is idle.
+
+        Bursts (held <Return>, repeated Reset clicks) collapse into a single trailing
+        render that reads the latest control values.
+        """
+        if self._render_pending:
+            return
+        self._render_pending = True
+        self.root.after_idle(self._flush_render)
+
+    def _flush_render(self) -> None:
+        self._render_pending = False
+        self._do_render()
+
+    def _do_render(self) -> None:
         try:
             axis = self.axis_var.get().strip().lower() or "x"
             center = self._parse_int(self.center_var.get(), name="center")
             span = self._parse_int(self.span_var.get(), name="span")
             max_h = self._parse_int(self.max_lca_var.get(), name="max_lca_height")
             direction = self._direction()
+        except Exception as e:
+            self._set_status(f"Error: {e}")
+            return
 
-            series = compute_adjacent_lca_heights(center=center, span=span, direction=direction)
+        self._render_generation += 1
+        params = (self._render_generation, axis, center, span, max_h, direction)
+        if span < _THREADED_MIN_SPAN:
+            # Errors go through _finish_render too, so a superseded threaded render can't
+            # leave the Render button disabled.
+            try:
+                series = compute_adjacent_lca_heights(center=center, span=span, direction=direction)
+            except Exception as e:
+                self._finish_render(params, None, e)
+                return
+            self._finish_render(params, series, None)
+            return
 
-            self.ax.clear()
+        # Wide spans: compute in a worker and hand the result back to the Tk thread,
+        # which does all of the matplotlib work.
+        self.render_button.configure(state=tk.DISABLED)
+        self._set_status(f"Computing {2 * span + 1} points...")
+
+        def _bg() -> None:
+            try:
+                series = compute_adjacent_lca_heights(center=center, span=span, direction=direction)
+            except Exception as e:
+                self._results.put((params, None, e))
+            else:
+                self._results.put((params, series, None))
+
+        self._workers_in_flight += 1
+        threading.Thread(target=_bg, daemon=True).start()
+        if self._poll_id is None:
+            self._poll_id = self.root.after(_RESULT_POLL_MS, self._poll_results)
+
+    def _poll_results(self) -> None:
+        self._poll_id = None
+        while True:
+            try:
+                params, series, error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._workers_in_flight -= 1
+            self._finish_render(params, series, error)
+        if self._workers_in_flight > 0:
+            self._poll_id = self.root.after(_RESULT_POLL_MS, self._poll_results)
+
+    def _finish_render(self, params, series, error: Optional[Exception]) -> None:
+        generation, axis, center, span, max_h, direction = params
+        if generation != self._render_generation:
+            return  # superseded by a newer render
+        self.render_button.configure(state=tk.NORMAL)
+        if error is not None:
+            self._set_status(f"Error: {error}")
+            return
 
-            # Plot offsets (so gigantic axis values are readable).
-            self.ax.plot(series.offsets, series.heights, linewidth=1.0)
+        try:
+            # Plot offsets (so gigantic axis values are readable). Past ~4 points per pixel
+            # column, plot a min/max envelope instead; the extra vertices are invisible.
+            xs, ys = series.offsets, series.heights
+            width_px = max(1, int(self.ax.bbox.width))
+            if len(ys) > 4 * width_px:
+                xs, ys = _minmax_envelope(xs, ys, width_px)
+            self._line.set_data(xs, ys)
 
             # Reference line
-            if max_h >= 0:
-                self.ax.axhline(max_h, color="#cc0000", linestyle="--", linewidth=1.0, alpha=0.8)
+            self._href.set_ydata([max_h, max_h])
+            self._href.set_visible(max_h >= 0)
 
             # Block boundary markers for that same h.
+            skipped_msg = None
+            segs = np.empty((0, 2, 2))
+            colors: list[str] = []
             if self.show_boundaries_var.get() and max_h >= 0:
                 starts, ends = block_boundary_offsets(
                     center=center, series_start=series.start, series_end=series.end, h=max_h
                 )
 
                 # Avoid drawing absurd numbers of lines (small h with big span).
-                max_lines = 200
+                max_lines = 2000
                 total = len(starts) + len(ends)
                 if total <= max_lines:
-                    for o in starts:
-                        self.ax.axvline(o, color="#008800", linewidth=0.8, alpha=0.25)
-                    for o in ends:
-                        self.ax.axvline(o, color="#880000", linewidth=0.8, alpha=0.25)
+                    bx = np.concatenate((np.asarray(starts, dtype=float), np.asarray(ends, dtype=float)))
+                    segs = np.empty((total, 2, 2))
+                    segs[:, :, 0] = bx[:, None]
+                    segs[:, 0, 1] = 0.0
+                    segs[:, 1, 1] = 1.0
+                    colors = ["#008800"] * len(starts) + ["#880000"] * len(ends)
                 else:
-                    self._set_status(
-                        f"Rendered (skipped {total} boundary lines; too many for h={max_h}, span={span})."
-                    )
+                    skipped_msg = f"Rendered (skipped {total} boundary lines; too many for h={max_h}, span={span})."
+            self._boundary_coll.set_segments(segs)
+            self._boundary_coll.set_color(colors)
 
             self.ax.set_title(
                 f"axis={axis}  center={center}  span={span}  dir={'+' if direction == 1 else '-'}1"
             )
-            self.ax.set_xlabel("offset from center (v - center)")
-            self.ax.set_ylabel("lca_height(v, v±1)")
-            self.ax.grid(True, alpha=0.25)
 
+            self.ax.relim()
+            self.ax.autoscale_view()
             if series.heights:
                 self.ax.set_ylim(0, max(series.heights) + 1)
 
@@ -205,7 +359,9 @@ class LCAPlotApp:
             self.canvas.draw_idle()
 
             # Update status last (so boundary message can override).
-            if "Rendered (skipped" not in self.status_var.get():
+            if skipped_msg is not None:
+                self._set_status(skipped_msg)
+            else:
                 self._set_status(
                     f"Rendered {len(series.heights)} points from v={series.start}..{series.end}. "
                     "Green=start-of-block, red=end-of-block (for h)."
@@ -225,6 +381,8 @@ def run_app(
     current_y: Optional[int] = None,
     current_z: Optional[int] = None,
 ) -> int:
+    # Load the backend before opening a window so missing GUI deps fail fast.
+    _load_tk_backend()
     root = tk.Tk()
     _ = LCAPlotApp(
         root,
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from decimal import Decimal
+from functools import lru_cache
 from typing import List, Optional, Tuple
 
 import numpy as np
-from mpl_toolkits.mplot3d.art3d import Poly3DCollection
 
 from cyberspace_core.coords import (
     AXIS_CENTER,
@@ -41,11 +41,11 @@ class SceneConfig:
     azim_deg: float = -58.0
 
     # Optional Earth-focused framing altitude (km above Earth's surface).
-    # When set, draw_scene() zooms to Earth-centered bounds sized by (R_earth + altitude).
+    # When set, build_scene() zooms to Earth-centered bounds sized by (R_earth + altitude).
     earth_view_altitude_km: Optional[float] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Marker:
     # Position in scene units.
     #
@@ -76,13 +76,17 @@ _GOLDEN_VECTOR_COORD_HEX: Tuple[Tuple[str, str], ...] = (
 )
 
 
+# km per axis unit (axis_km / 2^85), rounded once to float64.
+_KM_PER_AXIS_UNIT = float(DATASPACE_AXIS_KM / Decimal(AXIS_UNITS))
+
+
 def _axis_u85_to_km_from_center(u85: int) -> float:
     """Convert an unsigned 85-bit axis value to kilometers from cube center."""
 
     # km_from_center = (u - 2^84) * axis_km / 2^85
-    # Use Decimal for high precision, then convert to float for plotting.
-    km = (Decimal(u85 - AXIS_CENTER) * DATASPACE_AXIS_KM) / Decimal(AXIS_UNITS)
-    return float(km)
+    # Plotting only needs float64: the exact int offset is rounded once and scaled by
+    # a precomputed float. Exact conversions live in cyberspace_core.coords (Decimal).
+    return (u85 - AXIS_CENTER) * _KM_PER_AXIS_UNIT
 
 
 def coord_to_dataspace_km(coord: int) -> Tuple[float, float, float]:
@@ -99,7 +103,7 @@ def coord_to_dataspace_km(coord: int) -> Tuple[float, float, float]:
     Note: matplotlib's mplot3d treats its Z axis as the camera "up" axis.
     For semantic correctness (no axis mirroring), we map:
       (X_cs, Y_cs, Z_cs) -> (X_mpl, Y_mpl, Z_mpl) = (X_cs, Z_cs, Y_cs)
-    inside draw_scene().
+    inside build_scene().
     """
 
     x_u, y_u, z_u, _plane = coord_to_xyz(coord)
@@ -174,16 +178,200 @@ def _set_axes_equal(ax) -> None:
     ax.set_zlim3d([z_middle - plot_radius, z_middle + plot_radius])
 
 
-def draw_scene(
+def draw_markers(
     ax,
     *,
     cfg: SceneConfig,
-    markers: Optional[List[Marker]] = None,
-) -> None:
-    """Draw the dataspace scene into a provided 3D matplotlib axis.
+    markers: List[Marker],
+    animated: bool = False,
+) -> list:
+    """Draw markers (scatter points + optional labels) and return the created artists.
+
+    Returns one scatter per distinct marker shape, followed by the label texts in marker
+    order. With `animated=True` the artists are skipped by normal figure draws so callers can
+    blit them over a cached static background.
+    """
 
-    Markers positions are interpreted as (X_cs, Y_cs, Z_cs) kilometers from center.
-    Internally we map to matplotlib coordinates without mirroring:
+    artists = []
+    if not markers:
+        return artists
+
+    # (N, 3) cyberspace positions -> mpl (X_cs, Z_cs, Y_cs), same as cyberspace_to_mpl().
+    pts = np.array([m.position_km for m in markers], dtype=float)[:, [0, 2, 1]] * float(cfg.scale)
+
+    # One scatter per marker shape (a collection has a single marker path); colors,
+    # sizes and edges are per point.
+    by_shape: dict = {}
+    for i, m in enumerate(markers):
+        by_shape.setdefault(m.shape, []).append(i)
+    for shape, idx in by_shape.items():
+        group = [markers[i] for i in idx]
+        artists.append(
+            ax.scatter(
+                pts[idx, 0],
+                pts[idx, 1],
+                pts[idx, 2],
+                c=[m.color for m in group],
+                s=[m.size for m in group],
+                marker=shape,
+                depthshade=False,
+                edgecolors=[m.edge_color for m in group],
+                linewidths=[m.edge_width for m in group],
+                animated=animated,
+            )
+        )
+
+    for m, (px, py, pz) in zip(markers, pts):
+        if m.label:
+            artists.append(ax.text(px, py, pz, f" {m.label}", color=(m.label_color or m.color), animated=animated))
+    return artists
+
+
+def update_marker_artists(
+    ax,
+    slots: List[Tuple[str, object, object]],
+    *,
+    cfg: SceneConfig,
+    markers: List[Marker],
+) -> List[Tuple[str, object, object]]:
+    """Reuse animated marker artists across renders instead of re-creating them.
+
+    `slots` holds `(shape, scatter, text)` triples from a previous call (or `[]`). Each
+    marker updates its slot in place; a slot is only rebuilt when the marker shape changes
+    (matplotlib can't swap a scatter's marker path). Surplus slots are hidden, not removed.
+    Returns the (possibly grown) slot list.
+    """
+
+    s = float(cfg.scale)
+    slots = list(slots)
+    for i, m in enumerate(markers):
+        x_cs, y_cs, z_cs = m.position_km
+        px, py, pz = cyberspace_to_mpl(x_cs * s, y_cs * s, z_cs * s)
+        if i < len(slots) and slots[i][0] == m.shape:
+            _shape, sc, txt = slots[i]
+            sc._offsets3d = (np.array([px]), np.array([py]), np.array([pz]))
+            sc.set_facecolor(m.color)
+            sc.set_edgecolor(m.edge_color)
+            sc.set_sizes([m.size])
+            sc.set_linewidth(m.edge_width)
+            txt.set_position_3d((px, py, pz))
+        else:
+            if i < len(slots):
+                slots[i][1].remove()
+                slots[i][2].remove()
+            sc, txt = draw_markers(ax, cfg=cfg, markers=[replace(m, label=" ")], animated=True)
+            slot = (m.shape, sc, txt)
+            if i < len(slots):
+                slots[i] = slot
+            else:
+                slots.append(slot)
+        txt.set_text(f" {m.label}" if m.label else "")
+        txt.set_color(m.label_color or m.color)
+        sc.set_visible(True)
+        txt.set_visible(bool(m.label))
+
+    for _shape, sc, txt in slots[len(markers):]:
+        sc.set_visible(False)
+        txt.set_visible(False)
+    return slots
+
+
+def _readonly(*arrays: np.ndarray) -> Tuple[np.ndarray, ...]:
+    for a in arrays:
+        a.flags.writeable = False
+    return arrays
+
+
+# Scene meshes only depend on grid density / extent, so rebuilds reuse them. They are
+# shared between calls and marked read-only.
+@lru_cache(maxsize=8)
+def _grid_mesh(n: int, half: float) -> Tuple[np.ndarray, np.ndarray]:
+    xs = np.linspace(-half, half, n)
+    return _readonly(*np.meshgrid(xs, xs))
+
+
+@lru_cache(maxsize=16)
+def _grid_plane_segments(n: int, half: float, axis: int, value: float) -> np.ndarray:
+    """Segments of an n x n wireframe grid on the plane {mpl `axis` == value}.
+
+    Same rows-then-columns polylines as `plot_wireframe(rstride=1, cstride=1)`, shape
+    `(2n, n, 3)`, so the grid can go straight into a Line3DCollection.
+    """
+    a, b = _grid_mesh(n, half)
+    xyz = [a, b]
+    xyz.insert(axis, np.full_like(a, value))
+    grid = np.stack(xyz, axis=-1)
+    return _readonly(np.concatenate((grid, grid.transpose(1, 0, 2))))[0]
+
+
+def _add_grid_plane(ax, n: int, half: float, axis: int, value: float, **kwargs) -> None:
+    # One collection per plane (not one for all planes) keeps mplot3d's per-artist depth
+    # sorting against the Earth/black sun. Limits are set explicitly by the caller, so
+    # the segments aren't scanned for autoscaling.
+    from mpl_toolkits.mplot3d.art3d import Line3DCollection
+
+    ax.add_collection(Line3DCollection(_grid_plane_segments(n, half, axis, value), **kwargs), autolim=False)
+
+
+def _add_axis_arrows(ax, length: float) -> None:
+    # All three arrows in one quiver call: one collection and one autoscale pass
+    # instead of three.
+    zeros = _AXIS_ARROW_ORIGIN
+    ax.quiver(zeros, zeros, zeros, *(_AXIS_ARROW_DIRS * length), color="#FFFFFF", linewidth=1.2)
+
+
+_AXIS_ARROW_ORIGIN = np.zeros(3)
+_AXIS_ARROW_DIRS = np.eye(3)
+
+
+@lru_cache(maxsize=1)
+def _unit_sphere_mesh() -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    u = np.linspace(0, 2 * np.pi, 64)
+    v = np.linspace(0, np.pi, 32)
+    return _readonly(
+        np.outer(np.cos(u), np.sin(v)),
+        np.outer(np.sin(u), np.sin(v)),
+        np.outer(np.ones_like(u), np.cos(v)),
+    )
+
+
+@lru_cache(maxsize=1)
+def _unit_sphere_polys() -> Tuple[np.ndarray, np.ndarray]:
+    """Quads of the unit sphere exactly as `plot_surface` would build them.
+
+    With the default rcount/ccount the 64x32 mesh is sampled with rstride=2, cstride=1;
+    63 rows don't divide evenly, so all strips span 3 mesh rows (6-vertex polygons)
+    except the last, which spans 2 (4-vertex polygons). Returned as those two blocks,
+    in plot_surface's row-major order.
+    """
+    ux, uy, uz = _unit_sphere_mesh()
+    rows, cols = ux.shape
+    row_inds = list(range(0, rows - 1, 2)) + [rows - 1]
+    polys = []
+    for rs, rs_next in zip(row_inds, row_inds[1:]):
+        for cs in range(cols - 1):
+            # Perimeter walk (same vertex order as cbook._array_perimeter), per axis.
+            ps = []
+            for a in (ux, uy, uz):
+                patch = a[rs : rs_next + 1, cs : cs + 2]
+                ps.append(np.concatenate((patch[0, :-1], patch[:-1, -1], patch[-1, :0:-1], patch[:0:-1, 0])))
+            polys.append(np.array(ps).T)
+    split = len(polys) - (cols - 1)
+    return _readonly(np.array(polys[:split]), np.array(polys[split:]))
+
+
+@lru_cache(maxsize=2)
+def _unit_circle(n: int) -> Tuple[np.ndarray, np.ndarray]:
+    t = np.linspace(0, 2 * np.pi, n)
+    return _readonly(np.cos(t), np.sin(t))
+
+
+def build_scene(ax, *, cfg: SceneConfig) -> None:
+    """Clear the axis and draw the static dataspace scene (grid, Earth, black sun, axes).
+
+    Only needs re-running when `cfg` changes; markers go on top via `draw_markers` or
+    `update_marker_artists`. Scene geometry uses cyberspace axes mapped to matplotlib
+    without mirroring:
       (X_cs, Y_cs, Z_cs) -> (X_mpl, Y_mpl, Z_mpl) = (X_cs, Z_cs, Y_cs)
     """
 
@@ -198,59 +386,52 @@ def draw_scene(
     # Grids: midplane + top/bottom boundaries for cyberspace Y ("up")
     # In mpl coords, those planes are z = const.
     n = max(3, int(cfg.grid_lines))
-    xs = np.linspace(-half, half, n)
-    ys = np.linspace(-half, half, n)
-    X, Y = np.meshgrid(xs, ys)
 
     def grid_at_cs_y(y_cs_km: float) -> None:
         # constant mpl z
         _, _, z_mpl = cyberspace_to_mpl(0.0, y_cs_km * s, 0.0)
-        Z = np.full_like(X, z_mpl)
-        ax.plot_wireframe(
-            X,
-            Y,
-            Z,
-            rstride=1,
-            cstride=1,
-            color=cfg.grid_color,
-            linewidth=0.6,
-            alpha=0.6,
-        )
+        _add_grid_plane(ax, n, half, 2, z_mpl, color=cfg.grid_color, linewidth=0.6, alpha=0.6)
 
     if cfg.show_midplane:
         grid_at_cs_y(0.0)
     grid_at_cs_y(+half_cs)
     grid_at_cs_y(-half_cs)
 
+    # Imported here so `import viz` doesn't pull in matplotlib; by now the 3D axes exist anyway.
+    from matplotlib.colors import to_rgba
+    from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+
     # Earth sphere (to-scale relative to dataspace cube)
     # Since mpl's z axis is "up", and we've mapped cs Y->mpl Z, this makes Earth look upright.
     earth_radius_km = float(Decimal(WGS84_A_M) / Decimal(1000))
     r_e = earth_radius_km * s
 
-    u = np.linspace(0, 2 * np.pi, 64)
-    v = np.linspace(0, np.pi, 32)
-    xe = r_e * np.outer(np.cos(u), np.sin(v))
-    ye = r_e * np.outer(np.sin(u), np.sin(v))
-    ze = r_e * np.outer(np.ones_like(u), np.cos(v))
-    ax.plot_surface(
-        xe,
-        ye,
-        ze,
-        color=cfg.earth_color,
-        alpha=cfg.earth_alpha,
-        linewidth=0,
-        shade=True,
+    # Same polygons/shading as plot_surface(color=..., shade=True), built from cached
+    # unit-sphere quads instead of re-slicing the mesh into ~1000 patches per build.
+    strips, last_strip = _unit_sphere_polys()
+    ax.add_collection(
+        Poly3DCollection(
+            [*(strips * r_e), *(last_strip * r_e)],
+            facecolors=to_rgba(cfg.earth_color),
+            alpha=cfg.earth_alpha,
+            linewidth=0,
+            shade=True,
+        ),
+        autolim=False,
     )
 
-    t = np.linspace(0, 2 * np.pi, 256)
+    cos_t, sin_t = _unit_circle(256)
+    ring_a = r_e * cos_t
+    ring_b = r_e * sin_t
+    ring_0 = np.zeros_like(cos_t)
 
     # Equator ring in cyberspace coordinates: Y_cs=0.
     # In mpl coordinates, that is Z=0.
-    ax.plot(r_e * np.cos(t), r_e * np.sin(t), np.zeros_like(t), color="#7FD3FF", linewidth=1.0)
+    ax.plot(ring_a, ring_b, ring_0, color="#7FD3FF", linewidth=1.0)
 
     # Prime meridian ring: Z_cs=0 (great circle through +X and +Y).
     # In mpl coordinates, Z_cs maps to Y.
-    ax.plot(r_e * np.cos(t), np.zeros_like(t), r_e * np.sin(t), color="#7FD3FF", linewidth=1.0)
+    ax.plot(ring_a, ring_0, ring_b, color="#7FD3FF", linewidth=1.0)
 
     # Black sun: reference marker for +Z_cs (east direction).
     # In mpl coords, Z_cs maps to Y.
@@ -259,10 +440,10 @@ def draw_scene(
     black_sun_center = black_sun_circle_center_mpl(half_extent=half, radius=r_b)
 
     # Draw the black sun as a filled circle (disk) tangent to the +Z boundary.
-    t_circle = np.linspace(0, 2 * np.pi, 180)
-    xb = black_sun_center[0] + r_b * np.cos(t_circle)
+    cos_c, sin_c = _unit_circle(180)
+    xb = black_sun_center[0] + r_b * cos_c
     yb = np.full_like(xb, black_sun_center[1])
-    zb = black_sun_center[2] + r_b * np.sin(t_circle)
+    zb = black_sun_center[2] + r_b * sin_c
     disk_verts = [list(zip(xb, yb, zb))]
     ax.add_collection3d(
         Poly3DCollection(
@@ -277,31 +458,11 @@ def draw_scene(
 
     # Axis direction markers (helps disambiguate + and -)
     a = half * 0.22
-    ax.quiver(0, 0, 0, a, 0, 0, color="#FFFFFF", linewidth=1.2)
-    ax.quiver(0, 0, 0, 0, a, 0, color="#FFFFFF", linewidth=1.2)
-    ax.quiver(0, 0, 0, 0, 0, a, color="#FFFFFF", linewidth=1.2)
+    _add_axis_arrows(ax, a)
     ax.text(a, 0, 0, "+X", color="#FFFFFF")
     ax.text(0, a, 0, "+Z (black sun / east)", color="#FFFFFF")
     ax.text(0, 0, a, "+Y", color="#FFFFFF")
 
-    # Markers
-    for m in markers or []:
-        x_cs, y_cs, z_cs = m.position_km
-        px, py, pz = cyberspace_to_mpl(x_cs * s, y_cs * s, z_cs * s)
-        ax.scatter(
-            [px],
-            [py],
-            [pz],
-            color=m.color,
-            s=m.size,
-            marker=m.shape,
-            depthshade=False,
-            edgecolors=m.edge_color,
-            linewidths=m.edge_width,
-        )
-        if m.label:
-            ax.text(px, py, pz, f" {m.label}", color=(m.label_color or m.color))
-
     # Labels reflect cyberspace axes, even though mpl axes are permuted.
     ax.set_xlabel("X (prime meridian)")
     ax.set_ylabel("Z (black sun)")
@@ -330,18 +491,10 @@ def draw_scene(
     ax.set_zticks([])
 
 
-def draw_sector_scene(
-    ax,
-    *,
-    cfg: SceneConfig,
-    markers: Optional[List[Marker]] = None,
-    sector_label: str = "",
-) -> None:
-    """Draw a sector-local cube scene into a provided 3D matplotlib axis.
+def build_sector_scene(ax, *, cfg: SceneConfig, sector_label: str = "") -> None:
+    """Clear the axis and draw the static sector-local cube scene (no markers).
 
-    Marker positions are interpreted as sector-local normalized cyberspace coords in
-    [-0.5, +0.5) along each axis. The scene is a cube; no Earth or other global
-    geometry is rendered.
+    The scene is a cube; no Earth or other global geometry is rendered.
     """
 
 
@@ -352,60 +505,17 @@ def draw_sector_scene(
 
     # Sector cube wireframe (all 6 faces).
     n = max(3, int(cfg.grid_lines))
-    v = np.linspace(-half, half, n)
-    A, B = np.meshgrid(v, v)
-
-    def wf_x(x0: float) -> None:
-        Y = A
-        Z = B
-        X = np.full_like(Y, x0)
-        ax.plot_wireframe(X, Y, Z, rstride=1, cstride=1, color=cfg.grid_color, linewidth=0.6, alpha=0.8)
-
-    def wf_y(y0: float) -> None:
-        X = A
-        Z = B
-        Y = np.full_like(X, y0)
-        ax.plot_wireframe(X, Y, Z, rstride=1, cstride=1, color=cfg.grid_color, linewidth=0.6, alpha=0.8)
-
-    def wf_z(z0: float) -> None:
-        X = A
-        Y = B
-        Z = np.full_like(X, z0)
-        ax.plot_wireframe(X, Y, Z, rstride=1, cstride=1, color=cfg.grid_color, linewidth=0.6, alpha=0.8)
-
-    wf_x(-half)
-    wf_x(+half)
-    wf_y(-half)
-    wf_y(+half)
-    wf_z(-half)
-    wf_z(+half)
+    for axis in (0, 1, 2):  # mpl x, y, z faces
+        for value in (-half, +half):
+            _add_grid_plane(ax, n, half, axis, value, color=cfg.grid_color, linewidth=0.6, alpha=0.8)
 
     # Axis direction markers
     a = half * 0.55
-    ax.quiver(0, 0, 0, a, 0, 0, color="#FFFFFF", linewidth=1.2)
-    ax.quiver(0, 0, 0, 0, a, 0, color="#FFFFFF", linewidth=1.2)
-    ax.quiver(0, 0, 0, 0, 0, a, color="#FFFFFF", linewidth=1.2)
+    _add_axis_arrows(ax, a)
     ax.text(a, 0, 0, "+X", color="#FFFFFF")
     ax.text(0, a, 0, "+Z", color="#FFFFFF")
     ax.text(0, 0, a, "+Y", color="#FFFFFF")
 
-    # Markers
-    for m in markers or []:
-        x_cs, y_cs, z_cs = m.position_km
-        px, py, pz = cyberspace_to_mpl(x_cs * s, y_cs * s, z_cs * s)
-        ax.scatter(
-            [px],
-            [py],
-            [pz],
-            color=m.color,
-            s=m.size,
-            depthshade=False,
-            edgecolors=m.edge_color,
-            linewidths=m.edge_width,
-        )
-        if m.label:
-            ax.text(px, py, pz, f" {m.label}", color=(m.label_color or m.color))
-
     ax.set_xlabel("X (sector-local)")
     ax.set_ylabel("Z (sector-local)")
     ax.set_zlabel("Y (sector-local)")
@@ -426,12 +536,48 @@ def draw_sector_scene(
     ax.set_zticks([])
 
 
+def draw_scene(
+    ax,
+    *,
+    cfg: SceneConfig,
+    markers: Optional[List[Marker]] = None,
+) -> None:
+    """Draw the dataspace scene into a provided 3D matplotlib axis.
+
+    Markers positions are interpreted as (X_cs, Y_cs, Z_cs) kilometers from center.
+    """
+
+    build_scene(ax, cfg=cfg)
+    draw_markers(ax, cfg=cfg, markers=markers or [])
+
+
+def draw_sector_scene(
+    ax,
+    *,
+    cfg: SceneConfig,
+    markers: Optional[List[Marker]] = None,
+    sector_label: str = "",
+) -> None:
+    """Draw a sector-local cube scene into a provided 3D matplotlib axis.
+
+    Marker positions are interpreted as sector-local normalized cyberspace coords in
+    [-0.5, +0.5) along each axis.
+    """
+
+    build_sector_scene(ax, cfg=cfg, sector_label=sector_label)
+    draw_markers(ax, cfg=cfg, markers=markers or [])
+
+
 __all__ = [
     "Marker",
     "SceneConfig",
     "coord_to_dataspace_km",
     "cyberspace_to_mpl",
     "black_sun_circle_center_mpl",
+    "build_scene",
+    "build_sector_scene",
+    "draw_markers",
+    "update_marker_artists",
     "draw_scene",
     "draw_sector_scene",
     "golden_vector_markers",
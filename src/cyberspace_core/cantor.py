@@ -1,33 +1,52 @@
 from __future__ import annotations
 
 import hashlib
+from typing import Tuple
+
+# Bound once; hashlib.sha256 is OpenSSL-backed (SHA-NI where the CPU has it).
+_sha256 = hashlib.sha256
 
 
 def cantor_pair(a: int, b: int) -> int:
     s = a + b
-    return (s * (s + 1)) // 2 + b
+    # s*(s+1) is always even, so the halving is an exact shift.
+    return ((s * s + s) >> 1) + b
+
+
+def cantor_triple(a: int, b: int, c: int) -> int:
+    """cantor_pair(cantor_pair(a, b), c) in one call."""
+    s = a + b
+    s = ((s * s + s) >> 1) + b + c
+    return ((s * s + s) >> 1) + c
 
 
 def int_to_bytes_be_min(n: int) -> bytes:
     if n < 0:
         raise ValueError("expected non-negative int")
-    if n == 0:
-        return b"\x00"
-    return n.to_bytes((n.bit_length() + 7) // 8, "big")
+    return n.to_bytes((n.bit_length() + 7) >> 3 or 1, "big")
 
 
 def sha256(data: bytes) -> bytes:
-    return hashlib.sha256(data).digest()
+    return _sha256(data).digest()
 
 
 def sha256_hex(data: bytes) -> str:
-    return hashlib.sha256(data).hexdigest()
+    return _sha256(data).hexdigest()
 
 
 def sha256_int_hex(n: int) -> str:
     return sha256_hex(int_to_bytes_be_min(n))
 
 
+def sha256_int_chain_hex(n: int) -> Tuple[str, str]:
+    """Return (sha256(n_bytes).hex(), sha256(sha256(n_bytes)).hex()).
+
+    The second hash is taken over the first digest's bytes directly, with no hex round-trip.
+    """
+    h1 = _sha256(int_to_bytes_be_min(n)).digest()
+    return h1.hex(), _sha256(h1).hexdigest()
+
+
 def int_to_hex_be_min(n: int, *, prefix: str = "0x") -> str:
     """Hex string for an int using minimal big-endian bytes (0 -> 0x00).
 
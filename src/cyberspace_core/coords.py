@@ -41,8 +41,9 @@ This places Earth's center at axis midpoint `2^84` and yields an axis length of
 from __future__ import annotations
 
 import math
-from decimal import Decimal, localcontext, ROUND_HALF_EVEN
-from typing import Tuple, Union
+from decimal import Context, Decimal, getcontext, localcontext, ROUND_HALF_EVEN
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 AXIS_BITS = 85
 AXIS_UNITS = 1 << AXIS_BITS  # 2^85
@@ -54,6 +55,9 @@ CANONICAL_GPS_TO_DATASPACE_SPEC_VERSION = "2026-03-16-h34-corrected"
 # Decimal context used for canonical GPS->dataspace conversion.
 # This does *not* affect global Decimal state; we always use localcontext().
 DECIMAL_PREC = 96  # guard digits for trig + sqrt + scaling
+# Entered once per public entry point; private helpers run inside it rather than
+# pushing/popping their own context per call.
+_CANONICAL_CTX = Context(prec=DECIMAL_PREC, rounding=ROUND_HALF_EVEN)
 
 # Trig series termination + safety bound (consensus-critical).
 TRIG_EPS = Decimal("1e-88")
@@ -87,26 +91,91 @@ WGS84_A_M = Decimal("6378137")
 WGS84_F = Decimal(1) / Decimal("298.257223563")
 WGS84_E2 = WGS84_F * (Decimal(2) - WGS84_F)
 
+# Loop-invariant Decimals for the canonical path, built once. All are exact in
+# `_CANONICAL_CTX`, so using them does not change any rounding.
+_DEC_90 = Decimal(90)
+_DEC_180 = Decimal(180)
+_DEC_360 = Decimal(360)
+_DEC_1000 = Decimal(1000)
+_DEC_AXIS_CENTER = Decimal(AXIS_CENTER)
+with localcontext(_CANONICAL_CTX):
+    _ONE_MINUS_E2 = Decimal(1) - WGS84_E2
+
+
+def _compact_masks() -> Tuple[int, ...]:
+    # Masks for the shift/mask "compact every third bit" de-interleave, widened to 256 bits:
+    # step k keeps runs of 2^k bits spaced 3 * 2^k apart (0x9249..., 0x30c3..., 0xf00f..., ...).
+    masks = []
+    run = 1
+    while run < 256:
+        period = 3 * run
+        m = 0
+        for start in range(0, 256, period):
+            m |= ((1 << run) - 1) << start
+        masks.append(m & ((1 << 256) - 1))
+        run *= 2
+    return tuple(masks)
+
+
+_M0, _M1, _M2, _M3, _M4, _M5, _M6, _M7 = _compact_masks()
+_AXIS_MASK = (1 << AXIS_BITS) - 1
+
+
+def _compact_every_third(v: int) -> int:
+    """Gather bits 0, 3, 6, ... of `v` into a contiguous low-order integer."""
+    v &= _M0
+    v = (v ^ (v >> 2)) & _M1
+    v = (v ^ (v >> 4)) & _M2
+    v = (v ^ (v >> 8)) & _M3
+    v = (v ^ (v >> 16)) & _M4
+    v = (v ^ (v >> 32)) & _M5
+    v = (v ^ (v >> 64)) & _M6
+    v = (v ^ (v >> 128)) & _M7
+    return v
+
+
+def _spread_every_third(v: int) -> int:
+    """Scatter the low AXIS_BITS bits of `v` to bits 0, 3, 6, ... (inverse of compact)."""
+    v &= _AXIS_MASK
+    v = (v | (v << 128)) & _M6
+    v = (v | (v << 64)) & _M5
+    v = (v | (v << 32)) & _M4
+    v = (v | (v << 16)) & _M3
+    v = (v | (v << 8)) & _M2
+    v = (v | (v << 4)) & _M1
+    v = (v | (v << 2)) & _M0
+    return v
+
 
 def xyz_to_coord(x: int, y: int, z: int, plane: int = PLANE_DATASPACE) -> int:
     """Convert (x, y, z, plane) to a 256-bit interleaved coordinate."""
-    coord = plane & 1
-    for i in range(AXIS_BITS):
-        coord |= ((z >> i) & 1) << (1 + i * 3)
-        coord |= ((y >> i) & 1) << (2 + i * 3)
-        coord |= ((x >> i) & 1) << (3 + i * 3)
-    return coord
+    # Same shift/mask passes as coord_to_xyz, run in reverse (no per-bit loop).
+    return (
+        (_spread_every_third(x) << 3)
+        | (_spread_every_third(y) << 2)
+        | (_spread_every_third(z) << 1)
+        | (plane & 1)
+    )
 
 
 def coord_to_xyz(coord: int) -> Tuple[int, int, int, int]:
     """Convert a 256-bit interleaved coordinate back to (x, y, z, plane)."""
-    plane = coord & 1
-    x = y = z = 0
-    for i in range(AXIS_BITS):
-        z |= ((coord >> (1 + i * 3)) & 1) << i
-        y |= ((coord >> (2 + i * 3)) & 1) << i
-        x |= ((coord >> (3 + i * 3)) & 1) << i
-    return (x, y, z, plane)
+    # Each compact is a fixed 8-step shift/mask pass instead of an 85-iteration bit loop.
+    return (
+        _compact_every_third(coord >> 3),
+        _compact_every_third(coord >> 2),
+        _compact_every_third(coord >> 1),
+        coord & 1,
+    )
+
+
+def coord_to_xyz_from_bytes(buf: bytes) -> Tuple[int, int, int, int]:
+    """`coord_to_xyz` for a 32-byte big-endian coordinate buffer."""
+    if len(buf) != 32:
+        raise ValueError(f"coord buffer must be 32 bytes, got {len(buf)}")
+    # One C-level int.from_bytes + the shift/mask compaction beats unpacking uint64
+    # limbs and de-interleaving each limb separately in Python.
+    return coord_to_xyz(int.from_bytes(buf, "big"))
 
 
 def _clamp_int(v: int, lo: int, hi: int) -> int:
@@ -141,6 +210,49 @@ def geodetic_to_ecef_m_float(lat_deg: float, lon_deg: float, alt_m: float = 0.0)
     return (x, y, z)
 
 
+def gps_to_dataspace_xyz_float_batch(
+    lats_deg: Sequence[float],
+    lons_deg: Sequence[float],
+    alts_m: Optional[Sequence[float]] = None,
+) -> List[Tuple[int, int, int]]:
+    """Approximate `gps_to_dataspace_xyz` for many points using vectorized binary floats.
+
+    NOT canonical: results can differ from the Decimal path in the low bits (float64 trig
+    resolves to ~1e-16 relative, i.e. nanometers), so never use them for consensus data
+    such as spawn/hop events. Intended for bulk indexing and visualization.
+
+    Requires numpy (installed with the visualizer extra).
+    """
+    import numpy as np
+
+    lat = np.radians(np.asarray(lats_deg, dtype=np.float64))
+    lon = np.radians(np.asarray(lons_deg, dtype=np.float64))
+    alt = np.zeros_like(lat) if alts_m is None else np.asarray(alts_m, dtype=np.float64)
+
+    sin_lat = np.sin(lat)
+    cos_lat = np.cos(lat)
+    a = float(WGS84_A_M)
+    e2 = float(WGS84_E2)
+    n = a / np.sqrt(1.0 - e2 * sin_lat * sin_lat)
+
+    # Permuted to cyberspace axes (X_cs = X_ecef, Y_cs = Z_ecef, Z_cs = Y_ecef), in units
+    # relative to the axis center. The center is added as an exact int afterwards, since
+    # a float64 near 2^84 would only resolve 2^32 units.
+    scale = UNITS_PER_KM_INT / 1000.0
+    x_u = np.rint((n + alt) * cos_lat * np.cos(lon) * scale)
+    y_u = np.rint((n * (1.0 - e2) + alt) * sin_lat * scale)
+    z_u = np.rint((n + alt) * cos_lat * np.sin(lon) * scale)
+
+    return [
+        (
+            _clamp_int(AXIS_CENTER + int(x), 0, AXIS_MAX),
+            _clamp_int(AXIS_CENTER + int(y), 0, AXIS_MAX),
+            _clamp_int(AXIS_CENTER + int(z), 0, AXIS_MAX),
+        )
+        for x, y, z in zip(x_u.tolist(), y_u.tolist(), z_u.tolist())
+    ]
+
+
 def _to_decimal(x: NumberLike) -> Decimal:
     if isinstance(x, Decimal):
         return x
@@ -155,79 +267,81 @@ def _to_decimal(x: NumberLike) -> Decimal:
 
 
 def _wrap_lon_deg(lon_deg: Decimal) -> Decimal:
-    """Wrap longitude to [-180, 180)."""
-    with localcontext() as ctx:
-        ctx.prec = DECIMAL_PREC
-        # Python's Decimal % is well-defined.
-        lon = (lon_deg + Decimal(180)) % Decimal(360)
-        return lon - Decimal(180)
+    """Wrap longitude to [-180, 180). Caller holds `_CANONICAL_CTX`."""
+    # Python's Decimal % is well-defined.
+    lon = (lon_deg + _DEC_180) % _DEC_360
+    return lon - _DEC_180
 
 
 def _clamp_lat_deg(lat_deg: Decimal) -> Decimal:
-    if lat_deg < Decimal(-90):
-        return Decimal(-90)
-    if lat_deg > Decimal(90):
-        return Decimal(90)
+    if lat_deg < -_DEC_90:
+        return -_DEC_90
+    if lat_deg > _DEC_90:
+        return _DEC_90
     return lat_deg
 
 
+# Taylor term denominators for k = 1..TRIG_MAX_ITER, built once. Exact integers, so the
+# series does the same Decimal operations (and rounding) as building them per term.
+_SIN_TERM_DENOMS = tuple(Decimal((2 * k) * (2 * k + 1)) for k in range(1, TRIG_MAX_ITER + 1))
+_COS_TERM_DENOMS = tuple(Decimal((2 * k - 1) * (2 * k)) for k in range(1, TRIG_MAX_ITER + 1))
+
+
+@lru_cache(maxsize=1024)
 def _sin_cos_decimal(x: Decimal) -> Tuple[Decimal, Decimal]:
     """Deterministic sin/cos for Decimal radians.
 
     Uses range reduction to [-pi/2, pi/2] then Taylor series.
 
-    This is intended for consensus use (avoid platform libm variance).
+    This is intended for consensus use (avoid platform libm variance). Caller holds
+    `_CANONICAL_CTX`, so results depend only on the value of `x` and are cached:
+    whole-degree latitudes/longitudes recur often.
     """
-    with localcontext() as ctx:
-        ctx.prec = DECIMAL_PREC
-        ctx.rounding = ROUND_HALF_EVEN
-
-        # Reduce to (-pi, pi]
-        x = x % TWO_PI
-        if x > PI:
-            x -= TWO_PI
-
-        # Reduce to [-pi/2, pi/2] using symmetries.
-        cos_sign = Decimal(1)
-        if x > HALF_PI:
-            x = PI - x
-            cos_sign = Decimal(-1)
-        elif x < -HALF_PI:
-            x = -PI - x
-            cos_sign = Decimal(-1)
-
-        x2 = x * x
-
-        # Taylor series with deterministic termination.
-        # Terminate when abs(term) < TRIG_EPS (consensus-critical).
-
-        # sin
-        sin_sum = x
-        sin_term = x
-        for k in range(1, TRIG_MAX_ITER + 1):
-            # term *= -x^2 / ((2k)*(2k+1))
-            denom = Decimal((2 * k) * (2 * k + 1))
-            sin_term = -sin_term * x2 / denom
-            sin_sum += sin_term
-            if abs(sin_term) < TRIG_EPS:
-                break
-        else:
-            raise ValueError("sin() Taylor series did not converge")
-
-        # cos
-        cos_sum = Decimal(1)
-        cos_term = Decimal(1)
-        for k in range(1, TRIG_MAX_ITER + 1):
-            # term *= -x^2 / ((2k-1)*(2k))
-            denom = Decimal((2 * k - 1) * (2 * k))
-            cos_term = -cos_term * x2 / denom
-            cos_sum += cos_term
-            if abs(cos_term) < TRIG_EPS:
-                break
-        else:
-            raise ValueError("cos() Taylor series did not converge")
-
-        return (sin_sum, cos_sum * cos_sign)
+    # Reduce to (-pi, pi]
+    x = x % TWO_PI
+    if x > PI:
+        x -= TWO_PI
+
+    # Reduce to [-pi/2, pi/2] using symmetries.
+    cos_sign = Decimal(1)
+    if x > HALF_PI:
+        x = PI - x
+        cos_sign = Decimal(-1)
+    elif x < -HALF_PI:
+        x = -PI - x
+        cos_sign = Decimal(-1)
+
+    x2 = x * x
+    eps = TRIG_EPS
+
+    # Taylor series with deterministic termination.
+    # Terminate when abs(term) < TRIG_EPS (consensus-critical).
+
+    # sin
+    sin_sum = x
+    sin_term = x
+    for denom in _SIN_TERM_DENOMS:
+        # term *= -x^2 / ((2k)*(2k+1))
+        sin_term = -sin_term * x2 / denom
+        sin_sum += sin_term
+        if abs(sin_term) < eps:
+            break
+    else:
+        raise ValueError("sin() Taylor series did not converge")
+
+    # cos
+    cos_sum = Decimal(1)
+    cos_term = Decimal(1)
+    for denom in _COS_TERM_DENOMS:
+        # term *= -x^2 / ((2k-1)*(2k))
+        cos_term = -cos_term * x2 / denom
+        cos_sum += cos_term
+        if abs(cos_term) < eps:
+            break
+    else:
+        raise ValueError("cos() Taylor series did not converge")
+
+    return (sin_sum, cos_sum * cos_sign)
 
 
 def geodetic_to_ecef_m(lat_deg: NumberLike, lon_deg: NumberLike, alt_m: NumberLike = 0) -> Tuple[Decimal, Decimal, Decimal]:
@@ -238,43 +352,35 @@ def geodetic_to_ecef_m(lat_deg: NumberLike, lon_deg: NumberLike, alt_m: NumberLi
     - `lat_deg` is clamped to [-90, 90]
     - `lon_deg` is wrapped to [-180, 180)
     """
-    with localcontext() as ctx:
-        ctx.prec = DECIMAL_PREC
-        ctx.rounding = ROUND_HALF_EVEN
-
+    with localcontext(_CANONICAL_CTX):
         lat_d = _clamp_lat_deg(_to_decimal(lat_deg))
         lon_d = _wrap_lon_deg(_to_decimal(lon_deg))
         alt_d = _to_decimal(alt_m)
 
         # degrees -> radians
-        lat = lat_d * PI / Decimal(180)
-        lon = lon_d * PI / Decimal(180)
+        lat = lat_d * PI / _DEC_180
+        lon = lon_d * PI / _DEC_180
 
         sin_lat, cos_lat = _sin_cos_decimal(lat)
         sin_lon, cos_lon = _sin_cos_decimal(lon)
 
         # Radius of curvature in the prime vertical
-        one = Decimal(1)
-        n = WGS84_A_M / (one - WGS84_E2 * sin_lat * sin_lat).sqrt()
+        n = WGS84_A_M / (Decimal(1) - WGS84_E2 * sin_lat * sin_lat).sqrt()
 
         x = (n + alt_d) * cos_lat * cos_lon
         y = (n + alt_d) * cos_lat * sin_lon
-        z = (n * (one - WGS84_E2) + alt_d) * sin_lat
+        z = (n * _ONE_MINUS_E2 + alt_d) * sin_lat
         return (x, y, z)
 
 
 def _km_to_axis_u(km_from_center: Decimal) -> int:
     """Map kilometers (centered at 0) into an unsigned 85-bit axis value (Decimal).
 
-    Rounding is consensus-critical and uses ROUND_HALF_EVEN.
+    Rounding is consensus-critical and uses ROUND_HALF_EVEN. Caller holds `_CANONICAL_CTX`.
     """
-    with localcontext() as ctx:
-        ctx.prec = DECIMAL_PREC
-        ctx.rounding = ROUND_HALF_EVEN
-
-        u = km_from_center * UNITS_PER_KM + Decimal(AXIS_CENTER)
-        u_int = int(u.to_integral_value(rounding=ROUND_HALF_EVEN))
-        return _clamp_int(u_int, 0, AXIS_MAX)
+    u = km_from_center * UNITS_PER_KM + _DEC_AXIS_CENTER
+    u_int = int(u.to_integral_value(rounding=ROUND_HALF_EVEN))
+    return _clamp_int(u_int, 0, AXIS_MAX)
 
 
 def ecef_km_to_dataspace_xyz(x_km: NumberLike, y_km: NumberLike, z_km: NumberLike) -> Tuple[int, int, int]:
@@ -285,10 +391,7 @@ def ecef_km_to_dataspace_xyz(x_km: NumberLike, y_km: NumberLike, z_km: NumberLik
       Y_cs = Z_ecef
       Z_cs = Y_ecef
     """
-    with localcontext() as ctx:
-        ctx.prec = DECIMAL_PREC
-        ctx.rounding = ROUND_HALF_EVEN
-
+    with localcontext(_CANONICAL_CTX):
         x_km_d = _to_decimal(x_km)
         y_km_d = _to_decimal(y_km)
         z_km_d = _to_decimal(z_km)
@@ -313,11 +416,29 @@ def gps_to_dataspace_xyz(
     If clamp_to_surface is True, altitude is forced to 0m (WGS84 ellipsoid surface).
     """
     alt = Decimal(0) if clamp_to_surface else _to_decimal(altitude_m)
-    x_m, y_m, z_m = geodetic_to_ecef_m(lat_deg, lon_deg, alt)
+    ctx = getcontext()
+    return _gps_to_dataspace_xyz_cached(
+        _to_decimal(lat_deg), _to_decimal(lon_deg), alt, ctx.prec, ctx.rounding
+    )
+
+
+# Cached on the canonical Decimal inputs: the conversion is a pure function of their
+# values, and repeated positions (home base, presets, revisited places) are common.
+# The m -> km division runs at the caller's precision/rounding (as it always has), so
+# those are part of the key; otherwise the first caller's context would decide the
+# result for every later one.
+@lru_cache(maxsize=4096)
+def _gps_to_dataspace_xyz_cached(
+    lat_d: Decimal, lon_d: Decimal, alt_d: Decimal, prec: int, rounding: str
+) -> Tuple[int, int, int]:
+    x_m, y_m, z_m = geodetic_to_ecef_m(lat_d, lon_d, alt_d)
 
     # meters -> kilometers
-    km = Decimal(1000)
-    return ecef_km_to_dataspace_xyz(x_m / km, y_m / km, z_m / km)
+    with localcontext() as ctx:
+        ctx.prec = prec
+        ctx.rounding = rounding
+        x_km, y_km, z_km = x_m / _DEC_1000, y_m / _DEC_1000, z_m / _DEC_1000
+    return ecef_km_to_dataspace_xyz(x_km, y_km, z_km)
 
 
 def gps_to_dataspace_coord(
@@ -337,16 +458,37 @@ def gps_to_dataspace_coord(
     return xyz_to_coord(x, y, z, plane=PLANE_DATASPACE)
 
 
+def gps_to_dataspace_coord_batch(
+    points: Iterable[Tuple[NumberLike, NumberLike, NumberLike]],
+    *,
+    clamp_to_surface: bool = True,
+) -> List[int]:
+    """Convert many (lat, lon, altitude_m) points with `gps_to_dataspace_coord`.
+
+    Results are canonical (same Decimal path as the scalar function). Repeated points,
+    e.g. a stationary stretch of a GPS trail, are only converted once per batch.
+    """
+    seen: Dict[Tuple[NumberLike, NumberLike, NumberLike], int] = {}
+    out: List[int] = []
+    for point in points:
+        key = (point[0], point[1], point[2])
+        coord = seen.get(key)
+        if coord is None:
+            coord = gps_to_dataspace_coord(*key, clamp_to_surface=clamp_to_surface)
+            seen[key] = coord
+        out.append(coord)
+    return out
+
+
 def _axis_u_to_km(axis_u: int) -> Decimal:
-    """Map an unsigned 85-bit axis value back to centered kilometers."""
+    """Map an unsigned 85-bit axis value back to centered kilometers.
+
+    Caller holds `_CANONICAL_CTX`.
+    """
     if not (0 <= int(axis_u) <= AXIS_MAX):
         raise ValueError(f"axis value {axis_u} is out of range [0, {AXIS_MAX}]")
 
-    with localcontext() as ctx:
-        ctx.prec = DECIMAL_PREC
-        ctx.rounding = ROUND_HALF_EVEN
-
-        return (Decimal(int(axis_u)) - Decimal(AXIS_CENTER)) * KM_PER_UNIT
+    return (Decimal(int(axis_u)) - _DEC_AXIS_CENTER) * KM_PER_UNIT
 
 
 def dataspace_xyz_to_ecef_km(x: int, y: int, z: int) -> Tuple[Decimal, Decimal, Decimal]:
@@ -357,9 +499,10 @@ def dataspace_xyz_to_ecef_km(x: int, y: int, z: int) -> Tuple[Decimal, Decimal,
       Y_ecef = Z_cs
       Z_ecef = Y_cs
     """
-    x_cs_km = _axis_u_to_km(x)
-    y_cs_km = _axis_u_to_km(y)
-    z_cs_km = _axis_u_to_km(z)
+    with localcontext(_CANONICAL_CTX):
+        x_cs_km = _axis_u_to_km(x)
+        y_cs_km = _axis_u_to_km(y)
+        z_cs_km = _axis_u_to_km(z)
 
     x_ecef_km = x_cs_km
     y_ecef_km = z_cs_km
@@ -2,7 +2,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import List
 
-from cyberspace_core.cantor import cantor_pair, int_to_bytes_be_min, sha256
+from cyberspace_core.cantor import cantor_triple, int_to_bytes_be_min, sha256
 from cyberspace_core.movement import compute_subtree_cantor
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
@@ -36,7 +36,7 @@ def derive_region_n_for_height(
     rx = compute_subtree_cantor(bx, height, max_compute_height=max_compute_height)
     ry = compute_subtree_cantor(by, height, max_compute_height=max_compute_height)
     rz = compute_subtree_cantor(bz, height, max_compute_height=max_compute_height)
-    return cantor_pair(cantor_pair(rx, ry), rz)
+    return cantor_triple(rx, ry, rz)
 
 
 def derive_region_keys_from_region_n(region_n: int) -> tuple[bytes, str]:
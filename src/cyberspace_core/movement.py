@@ -2,10 +2,11 @@ from __future__ import annotations
 
 import sys
 from dataclasses import dataclass
+from functools import lru_cache
 
 from typing import Dict, List, Tuple
 
-from cyberspace_core.cantor import cantor_pair, int_to_bytes_be_min, sha256, sha256_int_hex
+from cyberspace_core.cantor import cantor_pair, cantor_triple, int_to_bytes_be_min, sha256, sha256_int_hex
 from cyberspace_core.coords import AXIS_BITS, AXIS_MAX
 from cyberspace_core.terrain import terrain_k
 
@@ -19,8 +20,7 @@ TEMPORAL_MAX_COMPUTE_HEIGHT = 17
 
 
 def find_lca_height(v1: int, v2: int) -> int:
-    if v1 == v2:
-        return 0
+    # Equal values XOR to 0, whose bit_length() is already 0.
     return (v1 ^ v2).bit_length()
 
 
@@ -45,9 +45,16 @@ def compute_subtree_cantor(base: int, height: int, *, max_compute_height: int =
         # Even constructing a range/list this large will crash (ssize_t overflow).
         raise ValueError(f"leaf_count {leaf_count} exceeds sys.maxsize; height {height} is too large")
 
-    values = list(range(base, base + leaf_count))
-    for _ in range(height):
-        values = [cantor_pair(values[i], values[i + 1]) for i in range(0, len(values), 2)]
+    # Leaf pairs are adjacent ints, and cantor_pair(a, a + 1) == 2 * (a + 1)^2, so the first
+    # level is built directly without materializing the leaves.
+    values = [2 * k * k for k in range(base + 1, base + leaf_count, 2)]
+    # Reduce the remaining levels in one buffer: the parents of level n overwrite its
+    # first n/2 slots, so no per-level list is allocated and only one level is ever alive.
+    n = leaf_count >> 1
+    while n > 1:
+        n >>= 1
+        for j in range(n):
+            values[j] = cantor_pair(values[2 * j], values[2 * j + 1])
     return values[0]
 
 
@@ -57,7 +64,7 @@ def compute_axis_cantor(v1: int, v2: int, *, max_compute_height: int = DEFAULT_M
     return compute_subtree_cantor(base, h, max_compute_height=max_compute_height)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MovementProof:
     cantor_x: int
     cantor_y: int
@@ -66,6 +73,9 @@ class MovementProof:
     proof_hash: str
 
 
+# Route planning and replays recompute proofs for the same hops. MovementProof is frozen, so
+# results can be shared; the size is kept modest because high hops carry multi-kB Cantor ints.
+@lru_cache(maxsize=1024)
 def compute_movement_proof_xyz(
     x1: int,
     y1: int,
@@ -86,7 +96,7 @@ def compute_movement_proof_xyz(
     cx = compute_axis_cantor(x1, x2, max_compute_height=max_compute_height)
     cy = compute_axis_cantor(y1, y2, max_compute_height=max_compute_height)
     cz = compute_axis_cantor(z1, z2, max_compute_height=max_compute_height)
-    combined = cantor_pair(cantor_pair(cx, cy), cz)
+    combined = cantor_triple(cx, cy, cz)
     proof_hash = sha256_int_hex(combined)
     return MovementProof(cx, cy, cz, combined, proof_hash)
 
@@ -132,7 +142,7 @@ def compute_hop_proof(
     cx = compute_axis_cantor(x1, x2, max_compute_height=max_compute_height)
     cy = compute_axis_cantor(y1, y2, max_compute_height=max_compute_height)
     cz = compute_axis_cantor(z1, z2, max_compute_height=max_compute_height)
-    region_n = cantor_pair(cantor_pair(cx, cy), cz)
+    region_n = cantor_triple(cx, cy, cz)
 
     # --- temporal component (§5.5.2) ---
     # K from terrain at destination (§5.5.2.1)
@@ -394,7 +404,7 @@ def compute_sidestep_proof(
     mx_int = int.from_bytes(mx, "big")
     my_int = int.from_bytes(my, "big")
     mz_int = int.from_bytes(mz, "big")
-    region_m = cantor_pair(cantor_pair(mx_int, my_int), mz_int)
+    region_m = cantor_triple(mx_int, my_int, mz_int)
 
     # --- temporal component (identical to hop proof) ---
     terrain_k_val = terrain_k(x=x2, y=y2, z=z2, plane=plane)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List
+from typing import List, Sequence
 
 from cyberspace_core.cantor import cantor_pair
 
@@ -15,14 +15,15 @@ class AxisCantorDebug:
     leaf_count: int
     leaf_min: int
     leaf_max: int
-    levels: List[List[int]]
+    levels: List[Sequence[int]]
     root: int
 
 
-def build_cantor_levels(base: int, height: int, *, max_height: int = 16) -> List[List[int]]:
+def build_cantor_levels(base: int, height: int, *, max_height: int = 16) -> List[Sequence[int]]:
     """Build the full Cantor tree levels for a subtree.
 
-    Returns levels[0] as leaves (size 2^h), levels[h] as root (size 1).
+    Returns levels[0] as leaves (size 2^h), levels[h] as root (size 1). The leaves are
+    consecutive ints, so levels[0] is a `range` rather than a materialized list.
 
     This is O(2^h) and intended for debugging/small heights only.
     """
@@ -31,11 +32,16 @@ def build_cantor_levels(base: int, height: int, *, max_height: int = 16) -> List
     if height > max_height:
         raise ValueError(f"height {height} exceeds max_height {max_height}")
 
-    levels: List[List[int]] = []
-    cur = list(range(base, base + (1 << height)))
+    leaves = range(base, base + (1 << height))
+    levels: List[Sequence[int]] = [leaves]
+    if height == 0:
+        return levels
+
+    # Leaf pairs are adjacent ints: cantor_pair(a, a + 1) == 2 * (a + 1)^2.
+    cur = [2 * k * k for k in range(base + 1, base + (1 << height), 2)]
     levels.append(cur)
 
-    for _ in range(height):
+    for _ in range(height - 1):
         cur = [cantor_pair(cur[i], cur[i + 1]) for i in range(0, len(cur), 2)]
         levels.append(cur)
 
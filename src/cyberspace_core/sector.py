@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Tuple
+from array import array
+from typing import List, NamedTuple, Sequence, Tuple
 
 from .coords import coord_to_xyz
 
@@ -9,12 +9,15 @@ from .coords import coord_to_xyz
 SECTOR_BITS_DEFAULT = 30
 
 
-@dataclass(frozen=True)
-class SectorId:
+class SectorId(NamedTuple):
     """A sector identifier (per-axis integer sector index).
 
     Sectoring is defined purely over XYZ (plane is separate), using fixed-size blocks:
       sector_bits = 30  =>  sector_size = 2^30 axis-units per sector.
+
+    A NamedTuple, so construction, hashing and equality are plain C tuple operations
+    (sectors are built per point when sectoring many coordinates). Instances also
+    unpack as `(sx, sy, sz)`.
     """
 
     sx: int
@@ -25,6 +28,54 @@ class SectorId:
         return f"{self.sx}-{self.sy}-{self.sz}"
 
 
+class SectorIdArray:
+    """Columnar storage for many SectorIds (three int64 columns).
+
+    Holds 24 bytes per sector instead of a tuple plus three ints. Sector indices must fit
+    in int64, which holds for the default sector_bits (85 - 30 = 55-bit indices); larger
+    indices raise OverflowError on insertion.
+    """
+
+    __slots__ = ("sx", "sy", "sz")
+
+    def __init__(self) -> None:
+        self.sx = array("q")
+        self.sy = array("q")
+        self.sz = array("q")
+
+    def __len__(self) -> int:
+        return len(self.sx)
+
+    def __getitem__(self, i: int) -> SectorId:
+        return SectorId(self.sx[i], self.sy[i], self.sz[i])
+
+    def append(self, sid: SectorId) -> None:
+        self.sx.append(sid[0])
+        self.sy.append(sid[1])
+        self.sz.append(sid[2])
+
+
+def xyz_to_sector_id_array(
+    xs: Sequence[int],
+    ys: Sequence[int],
+    zs: Sequence[int],
+    *,
+    sector_bits: int = SECTOR_BITS_DEFAULT,
+) -> SectorIdArray:
+    """`xyz_to_sector_id` for many points, stored columnar in a SectorIdArray."""
+
+    if sector_bits < 0:
+        raise ValueError("sector_bits must be >= 0")
+    if not (len(xs) == len(ys) == len(zs)):
+        raise ValueError("xs, ys and zs must have the same length")
+
+    out = SectorIdArray()
+    out.sx = array("q", [x >> sector_bits for x in xs])
+    out.sy = array("q", [y >> sector_bits for y in ys])
+    out.sz = array("q", [z >> sector_bits for z in zs])
+    return out
+
+
 def xyz_to_sector_id(*, x: int, y: int, z: int, sector_bits: int = SECTOR_BITS_DEFAULT) -> SectorId:
     if sector_bits < 0:
         raise ValueError("sector_bits must be >= 0")
@@ -34,8 +85,15 @@ def xyz_to_sector_id(*, x: int, y: int, z: int, sector_bits: int = SECTOR_BITS_D
 def coord_to_sector_id(*, coord: int, sector_bits: int = SECTOR_BITS_DEFAULT) -> Tuple[SectorId, int]:
     """Return (SectorId, plane) for an interleaved 256-bit coord int."""
 
-    x, y, z, plane = coord_to_xyz(coord)
-    return xyz_to_sector_id(x=x, y=y, z=z, sector_bits=sector_bits), plane
+    if sector_bits < 0:
+        raise ValueError("sector_bits must be >= 0")
+
+    # Axis bit i sits at coord bit 3i+3 (x), 3i+2 (y), 3i+1 (z). Dropping the low
+    # 3*sector_bits interleaved bits before de-interleaving yields x >> sector_bits etc.
+    # directly, without extracting the full axes first. (The "plane" coord_to_xyz reports
+    # for the shifted value is an axis bit, so the real one is taken from `coord`.)
+    sx, sy, sz, _ = coord_to_xyz(coord >> (3 * sector_bits))
+    return SectorId(sx, sy, sz), coord & 1
 
 
 def sector_base(*, s: int, sector_bits: int = SECTOR_BITS_DEFAULT) -> int:
@@ -84,17 +142,52 @@ def xyz_to_sector_local_centered(
 
     size = float(1 << sector_bits)
 
-    sid = xyz_to_sector_id(x=x, y=y, z=z, sector_bits=sector_bits)
+    sx = x >> sector_bits
+    sy = y >> sector_bits
+    sz = z >> sector_bits
 
-    bx = sid.sx << sector_bits
-    by = sid.sy << sector_bits
-    bz = sid.sz << sector_bits
+    lx = ((float(x - (sx << sector_bits)) + 0.5) / size) - 0.5
+    ly = ((float(y - (sy << sector_bits)) + 0.5) / size) - 0.5
+    lz = ((float(z - (sz << sector_bits)) + 0.5) / size) - 0.5
 
-    lx = ((float(x - bx) + 0.5) / size) - 0.5
-    ly = ((float(y - by) + 0.5) / size) - 0.5
-    lz = ((float(z - bz) + 0.5) / size) - 0.5
+    return SectorId(sx, sy, sz), (lx, ly, lz)
 
-    return sid, (lx, ly, lz)
+
+def xyz_to_sector_local_centered_batch(
+    xs: Sequence[int],
+    ys: Sequence[int],
+    zs: Sequence[int],
+    *,
+    sector_bits: int = SECTOR_BITS_DEFAULT,
+) -> Tuple[List[SectorId], List[Tuple[float, float, float]]]:
+    """`xyz_to_sector_local_centered` for many points (e.g. samples along a path).
+
+    Returns parallel lists of SectorIds and local coords. Values are identical to the scalar
+    function; the validation and per-sector constants are just done once for the batch.
+    """
+
+    if sector_bits < 0:
+        raise ValueError("sector_bits must be >= 0")
+    if not (len(xs) == len(ys) == len(zs)):
+        raise ValueError("xs, ys and zs must have the same length")
+
+    # v - base == v & mask, and dividing by a power of two is exact, so multiplying by
+    # its reciprocal rounds the same as the scalar path.
+    mask = (1 << sector_bits) - 1
+    inv_size = 1.0 / float(1 << sector_bits)
+
+    sids: List[SectorId] = []
+    locals_: List[Tuple[float, float, float]] = []
+    for x, y, z in zip(xs, ys, zs):
+        sids.append(SectorId(x >> sector_bits, y >> sector_bits, z >> sector_bits))
+        locals_.append(
+            (
+                (float(x & mask) + 0.5) * inv_size - 0.5,
+                (float(y & mask) + 0.5) * inv_size - 0.5,
+                (float(z & mask) + 0.5) * inv_size - 0.5,
+            )
+        )
+    return sids, locals_
 
 
 def coord_to_sector_local_centered(
@@ -108,6 +201,8 @@ def coord_to_sector_local_centered(
 
 
 def coords_in_same_sector(*, a: int, b: int, sector_bits: int = SECTOR_BITS_DEFAULT) -> bool:
-    sa, _pa = coord_to_sector_id(coord=a, sector_bits=sector_bits)
-    sb, _pb = coord_to_sector_id(coord=b, sector_bits=sector_bits)
-    return sa == sb
+    if sector_bits < 0:
+        raise ValueError("sector_bits must be >= 0")
+    # The sector indices are exactly the interleaved bits above 3*sector_bits (bit 0 is
+    # the plane), so two coords share a sector iff they agree on all of those bits.
+    return ((a ^ b) >> (3 * sector_bits + 1)) == 0
@@ -20,9 +20,10 @@ This produces a stable global distribution with mean 8 and max 16.
 The worst-case temporal computation is 2^16 = 65,536 Cantor pairs (~100 ms).
 """
 
-from typing import Tuple
+import hashlib
+from functools import lru_cache
+from typing import List, Sequence, Tuple
 
-from cyberspace_core.cantor import sha256
 from cyberspace_core.coords import xyz_to_coord
 
 
@@ -30,11 +31,40 @@ from cyberspace_core.coords import xyz_to_coord
 # extraction changed from full byte (32 bits) to low nibble (16 bits).
 TERRAIN_DOMAIN_V2 = b"CYBERSPACE_TERRAIN_K_V2"
 
+_sha256 = hashlib.sha256
 
-def _aligned(v: int, cell_bits: int) -> int:
-    if cell_bits <= 0:
-        return v
-    return (v >> cell_bits) << cell_bits
+# Hash input prefix per cell scale: domain + the cell_bits byte, built once.
+_CELL_PREFIX = tuple(TERRAIN_DOMAIN_V2 + bytes([bits]) for bits in range(85))
+# Aligning x/y/z to a cell clears their low `bits` bits, which in the interleaved coord
+# are bits 1..3*bits (bit 0 is the plane). Masking the coord is the same as
+# re-interleaving the aligned axes.
+_CELL_KEEP = tuple(~(((1 << (3 * bits)) - 1) << 1) for bits in range(85))
+_COORD_MASK = (1 << 256) - 1
+# Popcount of the low nibble of each byte value.
+_LOW_NIBBLE_POPCOUNT = bytes((b & 0x0F).bit_count() for b in range(256))
+
+
+def _hash_cell_nibble_popcount(bits: int, cell_coord: int) -> int:
+    """Popcount of the terrain nibble for one aligned cell."""
+    # Domain-separate by including the cell_bits byte.
+    digest = _sha256(_CELL_PREFIX[bits] + cell_coord.to_bytes(32, "big")).digest()
+    return _LOW_NIBBLE_POPCOUNT[digest[0]]  # low 4 bits only
+
+
+# Neighbouring coordinates share their coarse cells, so paths and repeated queries
+# mostly hit this cache instead of hashing again.
+_cell_nibble_popcount = lru_cache(maxsize=65536)(_hash_cell_nibble_popcount)
+
+
+@lru_cache(maxsize=16)
+def _cell_scales(cell_bits: Tuple[int, ...]) -> Tuple[Tuple[int, int], ...]:
+    """Validate `cell_bits` once per distinct tuple; return (bits, coord keep-mask) pairs."""
+    if len(cell_bits) != 4:
+        raise ValueError("cell_bits must have exactly 4 entries (4 nibbles => 16 bits)")
+    for bits in cell_bits:
+        if bits < 0 or bits > 84:
+            raise ValueError("cell_bits entries must be within [0, 84]")
+    return tuple((bits, _CELL_KEEP[bits]) for bits in cell_bits)
 
 
 def terrain_k(
@@ -56,33 +86,52 @@ def terrain_k(
     Spatial correlation comes from aligning coords to cells at multiple scales.
     """
 
-    if len(cell_bits) != 4:
-        raise ValueError("cell_bits must have exactly 4 entries (4 nibbles => 16 bits)")
+    scales = _cell_scales(tuple(cell_bits))
 
     if plane not in (0, 1):
         raise ValueError("plane must be 0 or 1")
 
-    word = 0
+    coord = xyz_to_coord(x, y, z, plane=plane)
+    # popcount(word) is the sum of the per-nibble popcounts, so it is summed as
+    # the nibbles are produced instead of assembling the 16-bit word.
+    k = 0
+    for bits, keep in scales:
+        k += _cell_nibble_popcount(bits, coord & keep)
+    return k
 
-    for bits in cell_bits:
-        if bits < 0 or bits > 84:
-            raise ValueError("cell_bits entries must be within [0, 84]")
 
-        bx = _aligned(x, bits)
-        by = _aligned(y, bits)
-        bz = _aligned(z, bits)
-
-        coord = xyz_to_coord(bx, by, bz, plane=plane)
-        coord_bytes = coord.to_bytes(32, "big")
+def terrain_k_grid(
+    xs: Sequence[int],
+    ys: Sequence[int],
+    zs: Sequence[int],
+    *,
+    plane: int,
+    cell_bits: Tuple[int, int, int, int] = (3, 7, 9, 11),
+) -> List[int]:
+    """`terrain_k` for many coordinates at once (e.g. a preview grid or path).
 
-        # Domain-separate by including the cell_bits byte.
-        digest = sha256(TERRAIN_DOMAIN_V2 + bytes([bits]) + coord_bytes)
-        nibble = digest[0] & 0x0F  # low 4 bits only
+    Each point is interleaved once, and each aligned cell is hashed once per scale no
+    matter how many of the points fall inside it. Results match `terrain_k` per point.
+    """
 
-        word = (word << 4) | nibble
+    scales = _cell_scales(tuple(cell_bits))
 
-    # int.bit_count() counts 1-bits in the binary representation.
-    return int(word).bit_count()
+    if plane not in (0, 1):
+        raise ValueError("plane must be 0 or 1")
+    if not (len(xs) == len(ys) == len(zs)):
+        raise ValueError("xs, ys and zs must have the same length")
+
+    coords = [xyz_to_coord(x, y, z, plane=plane) for x, y, z in zip(xs, ys, zs)]
+    ks = [0] * len(coords)
+    for bits, keep in scales:
+        seen = {}
+        for i, coord in enumerate(coords):
+            cell = coord & keep
+            pc = seen.get(cell)
+            if pc is None:
+                pc = seen[cell] = _hash_cell_nibble_popcount(bits, cell)
+            ks[i] += pc
+    return ks
 
 
 def terrain_k_from_coord256(
@@ -92,10 +141,13 @@ def terrain_k_from_coord256(
 ) -> int:
     """Same as terrain_k but takes a coord256 int."""
 
-    from cyberspace_core.coords import coord_to_xyz
-
-    x, y, z, plane = coord_to_xyz(coord)
-    return terrain_k(x=x, y=y, z=z, plane=plane, cell_bits=cell_bits)
+    # The cell masks apply to the interleaved coord directly, so there is no need to
+    # de-interleave into x/y/z and interleave again.
+    coord &= _COORD_MASK
+    k = 0
+    for bits, keep in _cell_scales(tuple(cell_bits)):
+        k += _cell_nibble_popcount(bits, coord & keep)
+    return k
 
 
 # ------------------------------------------------------------------
@@ -128,6 +180,7 @@ __all__ = [
     "TERRAIN_DOMAIN_V2",
     "terrain_k",
     "terrain_k_from_coord256",
+    "terrain_k_grid",
     # deprecated
     "TERRAIN_DOMAIN_V1",
     "terrain_k_popcount32",
@@ -1,6 +1,7 @@
 import unittest
 
 from cyberspace_cli.lcaplot import block_boundary_offsets, compute_adjacent_lca_heights
+from cyberspace_core.movement import find_lca_height
 
 
 class TestLCAPlot(unittest.TestCase):
@@ -15,6 +16,15 @@ class TestLCAPlot(unittest.TestCase):
         s = compute_adjacent_lca_heights(center=16, span=0, direction=-1)
         self.assertEqual(s.heights, [5])
 
+    def test_large_span_matches_scalar_lca_across_wide_boundaries(self) -> None:
+        # Spans large enough for the vectorized path, centered on 2^62 / 2^84 carries.
+        for center in (1 << 62, 1 << 84, (1 << 85) - 200):
+            for direction in (1, -1):
+                s = compute_adjacent_lca_heights(center=center, span=300, direction=direction)
+                expected = [find_lca_height(v, v + direction) for v in range(s.start, s.end + 1)]
+                self.assertEqual(s.heights, expected)
+                self.assertEqual(s.offsets, [v - center for v in range(s.start, s.end + 1)])
+
     def test_block_boundaries_for_h4(self) -> None:
         # With h=4, block size is 16, so within [0..31]: starts at 0,16; ends at 15,31.
         starts, ends = block_boundary_offsets(center=0, series_start=0, series_end=31, h=4)
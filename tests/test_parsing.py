@@ -34,6 +34,11 @@ class TestParsing(unittest.TestCase):
         with self.assertRaises(ValueError):
             normalize_hex_32("0xzz")
 
+    def test_normalize_hex_32_rejects_int_literal_extras(self) -> None:
+        for bad in ("0x-1", "+ab", "a_b", "ab cd"):
+            with self.assertRaises(ValueError, msg=bad):
+                normalize_hex_32(bad)
+
 
 if __name__ == "__main__":
     unittest.main()
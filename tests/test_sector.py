@@ -8,6 +8,9 @@ from cyberspace_core.sector import (
     coord_to_sector_local_centered,
     xyz_to_sector_bounds,
     xyz_to_sector_id,
+    xyz_to_sector_id_array,
+    xyz_to_sector_local_centered,
+    xyz_to_sector_local_centered_batch,
 )
 
 
@@ -60,6 +63,38 @@ class TestSector(unittest.TestCase):
             self.assertGreaterEqual(v, -0.5)
             self.assertLess(v, 0.5)
 
+    def test_coord_to_sector_id_matches_axis_shifts(self) -> None:
+        x, y, z = (1 << 84) + 0x1234567, (1 << 70) - 1, 0x5A5A5A5A5A
+        for plane in (0, 1):
+            c = xyz_to_coord(x, y, z, plane=plane)
+            for bits in (0, 1, 30, 84, 85):
+                sid, p = coord_to_sector_id(coord=c, sector_bits=bits)
+                self.assertEqual(p, plane)
+                self.assertEqual(sid, xyz_to_sector_id(x=x, y=y, z=z, sector_bits=bits))
+
+    def test_sector_id_array_matches_scalar(self) -> None:
+        size = 1 << SECTOR_BITS_DEFAULT
+        pts = [(0, 0, 0), (size + 1, 2 * size, 3 * size - 1), ((1 << 85) - 1, 1 << 84, 12345)]
+
+        arr = xyz_to_sector_id_array([p[0] for p in pts], [p[1] for p in pts], [p[2] for p in pts])
+        self.assertEqual(len(arr), len(pts))
+        for i, (x, y, z) in enumerate(pts):
+            self.assertEqual(arr[i], xyz_to_sector_id(x=x, y=y, z=z))
+
+        arr.append(xyz_to_sector_id(x=size, y=size, z=size))
+        self.assertEqual(arr[-1], (1, 1, 1))
+
+    def test_sector_local_centered_batch_matches_scalar(self) -> None:
+        b = SECTOR_BITS_DEFAULT
+        size = 1 << b
+        pts = [(0, 0, 0), (size - 1, size, 2 * size + 17), ((1 << 84) + 12345, (1 << 84) - 1, 7)]
+
+        sids, locals_ = xyz_to_sector_local_centered_batch(
+            [p[0] for p in pts], [p[1] for p in pts], [p[2] for p in pts]
+        )
+        expected = [xyz_to_sector_local_centered(x=x, y=y, z=z) for x, y, z in pts]
+        self.assertEqual(list(zip(sids, locals_)), expected)
+
     def test_coords_in_same_sector(self) -> None:
         b = SECTOR_BITS_DEFAULT
         size = 1 << b
@@ -28,6 +28,28 @@ class TestTerrainK(unittest.TestCase):
         self.assertGreaterEqual(k, 0)
         self.assertLessEqual(k, 16)
 
+    def test_terrain_k_grid_matches_scalar(self) -> None:
+        from cyberspace_core.terrain import terrain_k_grid
+
+        pts = [(4104 + i, i // 3, (1 << 84) + 5 * i) for i in range(64)]
+        xs, ys, zs = zip(*pts)
+        for plane in (0, 1):
+            expected = [terrain_k(x=x, y=y, z=z, plane=plane) for x, y, z in pts]
+            self.assertEqual(terrain_k_grid(xs, ys, zs, plane=plane), expected)
+
+    def test_terrain_k_matches_explicit_cell_alignment(self) -> None:
+        from cyberspace_core.coords import xyz_to_coord
+        from cyberspace_core.terrain import TERRAIN_DOMAIN_V2
+
+        x, y, z = (1 << 84) + 0x5A5A5, 0x123456789, 4104
+        for plane in (0, 1):
+            word = 0
+            for bits in (3, 7, 9, 11):
+                coord = xyz_to_coord((x >> bits) << bits, (y >> bits) << bits, (z >> bits) << bits, plane)
+                digest = sha256(TERRAIN_DOMAIN_V2 + bytes([bits]) + coord.to_bytes(32, "big"))
+                word = (word << 4) | (digest[0] & 0x0F)
+            self.assertEqual(terrain_k(x=x, y=y, z=z, plane=plane), word.bit_count())
+
 
 class TestTemporalAxis(unittest.TestCase):
     def test_temporal_seed_from_zero_prev_id(self) -> None:
@@ -45,6 +67,13 @@ class TestTemporalAxis(unittest.TestCase):
         self.assertEqual(t_base, 0)
         cantor_t = compute_subtree_cantor(t_base, k, max_compute_height=17)
 
+    def test_subtree_cantor_matches_pairwise_reduction(self) -> None:
+        for base, height in [(0, 1), (7, 3), ((1 << 84) - 16, 4)]:
+            values = list(range(base, base + (1 << height)))
+            while len(values) > 1:
+                values = [cantor_pair(values[i], values[i + 1]) for i in range(0, len(values), 2)]
+            self.assertEqual(compute_subtree_cantor(base, height), values[0])
+
     def test_previous_event_id_must_be_64_chars(self) -> None:
         with self.assertRaises(ValueError):
             compute_hop_proof(
@@ -1,6 +1,6 @@
 import unittest
 
-from cyberspace_cli.toward import choose_next_axis_value_toward, choose_next_hop_xyz
+from cyberspace_cli.toward import choose_next_axis_value_toward, choose_next_hop_xyz, choose_next_hop_xyz_batch
 
 
 class TestToward(unittest.TestCase):
@@ -20,6 +20,20 @@ class TestToward(unittest.TestCase):
         self.assertTrue(hop.y.next > 0)
         self.assertTrue(hop.z.next > 0)
 
+    def test_choose_next_hop_xyz_batch_matches_scalar(self) -> None:
+        cur = [(0, 0, 0), (100, 5003, 7), ((1 << 84) + 7, 2, (1 << 85) - 1), (9, 9, 9)]
+        tgt = [(800, 900, 1000), (200, 10, 7), (0, 1 << 40, 0), (9, 9, 9)]
+        for h in (1, 3, 20):
+            got = choose_next_hop_xyz_batch(cur, tgt, max_lca_height=h)
+            for (x, y, z), (tx, ty, tz), nxt in zip(cur, tgt, got):
+                hop = choose_next_hop_xyz(x=x, y=y, z=z, tx=tx, ty=ty, tz=tz, max_lca_height=h)
+                self.assertEqual(nxt, (hop.x.next, hop.y.next, hop.z.next))
+        # 5000 is the bottom of its 2-wide block, so it cannot move down with h=1.
+        with self.assertRaises(ValueError):
+            choose_next_hop_xyz_batch([(5000, 0, 0)], [(10, 0, 0)], max_lca_height=1)
+        with self.assertRaises(ValueError):
+            choose_next_hop_xyz_batch([(0, 0, 0)], [(1, 0, 0)], max_lca_height=0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,14 @@
 import unittest
+from decimal import Decimal
 
-from cyberspace_core.coords import gps_to_dataspace_coord
+from cyberspace_core.coords import (
+    AXIS_MAX,
+    coord_to_xyz,
+    coord_to_xyz_from_bytes,
+    gps_to_dataspace_coord,
+    gps_to_dataspace_coord_batch,
+    xyz_to_coord,
+)
 from cyberspace_core.cantor import sha256, sha256_int_hex
 from cyberspace_core.movement import compute_hop_proof, compute_movement_proof_xyz
 from cyberspace_cli.nostr_event import make_hop_event, make_spawn_event
@@ -60,6 +68,24 @@ class TestVectors(unittest.TestCase):
 
         self.assertEqual(encryption_key, "4e02171a1986de2299e3abe37a00b419d853da9bcab7139d76189f5506b138f6")
         self.assertEqual(discovery_id, "b3e3141659d48d3f7e39a684ab9f193badc11497ea6c3d0f89fefd8e9dbc85c5")
+
+    def test_coord_xyz_roundtrip_edge_values(self) -> None:
+        cases = [
+            (0, 0, 0, 0),
+            (AXIS_MAX, AXIS_MAX, AXIS_MAX, 1),
+            (AXIS_MAX, 0, 1, 0),
+            (1 << 84, (1 << 84) - 1, 0x155555555555555555555, 1),
+            (0x123456789ABCDEF012345, 0x0FEDCBA9876543210FEDC, 0x1AAAAAAAAAAAAAAAAAAAA, 0),
+        ]
+        for x, y, z, plane in cases:
+            coord = xyz_to_coord(x, y, z, plane)
+            self.assertLess(coord, 1 << 256)
+            self.assertEqual(coord_to_xyz(coord), (x, y, z, plane))
+            self.assertEqual(coord_to_xyz_from_bytes(coord.to_bytes(32, "big")), (x, y, z, plane))
+        self.assertEqual(coord_to_xyz((1 << 256) - 1), (AXIS_MAX, AXIS_MAX, AXIS_MAX, 1))
+        with self.assertRaises(ValueError):
+            coord_to_xyz_from_bytes(b"\x00" * 31)
+
     def test_gps_golden_vectors_subset(self) -> None:
         # Consensus-critical outputs (copied from v2 selftest).
         vectors = [
@@ -100,9 +126,41 @@ class TestVectors(unittest.TestCase):
                 "c4924924924924924924921f79235dae293ada913e78294253a235239a332854",
             ),
         ]
-        for name, lat, lon, expected_hex in vectors:
-            got = gps_to_dataspace_coord(lat, lon).to_bytes(32, "big").hex()
-            self.assertEqual(got, expected_hex, msg=name)
+        # One comparison keyed by vector name: a failure diffs every mismatching vector at once.
+        got = {name: gps_to_dataspace_coord(lat, lon).to_bytes(32, "big").hex() for name, lat, lon, _hex in vectors}
+        self.assertEqual(got, {name: h for name, _lat, _lon, h in vectors})
+
+        # Batch path must be bit-identical, including repeated points.
+        points = [(lat, lon, "0") for _name, lat, lon, _hex in vectors]
+        batch = gps_to_dataspace_coord_batch(points + points[:2])
+        expected = [int(h, 16) for _name, _lat, _lon, h in vectors]
+        self.assertEqual(batch, expected + expected[:2])
+
+        # Cached geodetic conversion: equal values given as str/Decimal hit the same entry.
+        self.assertEqual(gps_to_dataspace_coord(Decimal("51.5074"), Decimal("-0.1278")), expected[4])
+        self.assertEqual(gps_to_dataspace_coord("51.5074", "-0.1278"), expected[4])
+
+        # The cache must not let an earlier caller's Decimal context leak into later results.
+        from decimal import localcontext
+
+        with localcontext() as ctx:
+            ctx.prec = 6
+            low = gps_to_dataspace_coord("12.3456", "65.4321")
+        self.assertNotEqual(gps_to_dataspace_coord("12.3456", "65.4321"), low)
+
+    def test_gps_float_batch_approximates_canonical(self) -> None:
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            self.skipTest("numpy not installed")
+        from cyberspace_core.coords import gps_to_dataspace_xyz, gps_to_dataspace_xyz_float_batch
+
+        points = [(0.0, 0.0), (90.0, 0.0), (-33.8688, 151.2093), (51.5074, -0.1278)]
+        approx = gps_to_dataspace_xyz_float_batch([p[0] for p in points], [p[1] for p in points])
+        for (lat, lon), got in zip(points, approx):
+            for a, b in zip(got, gps_to_dataspace_xyz(str(lat), str(lon))):
+                # Non-canonical: float drift well under a micrometer is allowed.
+                self.assertLess(abs(a - b), 1 << 12)
 
     def test_movement_proof_doc_example(self) -> None:
         # From CYBERSPACE_V2.md example: (0,0,0) -> (3,2,1)
@@ -115,6 +173,8 @@ class TestVectors(unittest.TestCase):
             proof.proof_hash,
             "9306cfcf163adfa9a1f34933091a445bbbc77de02a1e504eba9d6bcd5950b414",
         )
+        # Repeated hops are served from the proof cache.
+        self.assertIs(compute_movement_proof_xyz(0, 0, 0, 3, 2, 1), proof)
 
         # Location-based encryption lookup id: sha256(sha256(cantor_number))
         encryption_key = sha256_int_hex(proof.combined)
@@ -142,6 +202,16 @@ class TestVectors(unittest.TestCase):
         self.assertEqual(encryption_key, "d1ed6818770b37a3d68c97fd65cd07d3af24a705ef8eb681fea99172b8eadf0d")
         self.assertEqual(discovery_id, "7b67be1e49962882683bc3b3a1be728136754c9fbe9b9a75c4a3e2a629c2d97a")
 
+        from cyberspace_core.cantor import sha256_int_chain_hex
+
+        self.assertEqual(sha256_int_chain_hex(combined), (encryption_key, discovery_id))
+
+        from cyberspace_core.cantor import cantor_triple
+
+        self.assertEqual(cantor_triple(cx, cy, cz), combined)
+        for t in [(0, 0, 0), (1, 2, 3), (100, 0, 7), (2**85 - 1, 2**84, 5)]:
+            self.assertEqual(cantor_triple(*t), cantor_pair(cantor_pair(t[0], t[1]), t[2]))
+
     def test_hop_proof_spec_vector_4104(self) -> None:
         """Spec §5.6.1: (0,0,0)→(4104,0,0) with prev_id=zeros.
 
@@ -191,6 +261,44 @@ class TestVectors(unittest.TestCase):
         )
         self.assertEqual(hop["id"], "4cda3483928f30e4c3dfd85cb71401f0a439601ef923e19cba57ca86853cc75e")
 
+    def test_nostr_event_id_batch_matches_single(self) -> None:
+        from cyberspace_cli.nostr_event import compute_event_ids_hex_batch
+
+        spawn = make_spawn_event(pubkey_hex="00" * 32, created_at=1700000000, coord_hex="11" * 32)
+        other = make_spawn_event(pubkey_hex="ab" * 32, created_at=1700000001, coord_hex="22" * 32)
+        self.assertEqual(compute_event_ids_hex_batch([spawn, other, spawn]), [spawn["id"], other["id"], spawn["id"]])
+
+        # Pubkeys that need JSON escaping must hash exactly like the single-event path.
+        from cyberspace_cli.nostr_event import compute_event_id_hex
+
+        odd = dict(spawn, pubkey='q"\\x\u00e9')
+        events = [spawn, other, odd, spawn]
+        expected = [
+            compute_event_id_hex(
+                pubkey_hex=ev["pubkey"],
+                created_at=ev["created_at"],
+                kind=ev["kind"],
+                tags=ev["tags"],
+                content=ev["content"],
+            )
+            for ev in events
+        ]
+        self.assertEqual(compute_event_ids_hex_batch(events), expected)
+
+    def test_sign_events_batch_signatures_verify(self) -> None:
+        from coincurve import PublicKeyXOnly
+
+        from cyberspace_cli.nostr_keys import pubkey_hex_from_privkey, sign_events_batch
+
+        privkey = bytes.fromhex("22" * 32)
+        ids = [sha256(bytes([i])).hex() for i in range(4)]
+        sigs = sign_events_batch(privkey, ids)
+        self.assertEqual(len(sigs), len(ids))
+
+        pub = PublicKeyXOnly(bytes.fromhex(pubkey_hex_from_privkey(privkey)))
+        for eid, sig in zip(ids, sigs):
+            self.assertTrue(pub.verify(bytes.fromhex(sig), bytes.fromhex(eid)), msg=eid)
+
 
 if __name__ == "__main__":
     unittest.main()